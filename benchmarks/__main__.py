@@ -0,0 +1,124 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from typing import Any
+
+from .suite import BENCHMARKS
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+
+def _git(*args: str) -> str:
+    try:
+        completed = subprocess.run(['git', *args], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+    return completed.stdout.strip()
+
+
+def _measure(name: str, tests_dir: Path, repeat: int) -> dict[str, Any]:
+    bench = BENCHMARKS[name](tests_dir / name)
+    try:
+        # plugin prints reported issues, they would drown results
+        with contextlib.redirect_stdout(io.StringIO()):
+            timer = timeit.Timer(bench.run)
+            number, _ = timer.autorange()
+            timings = timer.repeat(repeat=repeat, number=number)
+    finally:
+        if bench.close:
+            bench.close()
+    per_item = [timing / number / bench.items for timing in timings]
+    return {'min': min(per_item), 'max': max(per_item), 'number': number, 'items': bench.items}
+
+
+def _previous_results(output_dir: Path, commit: str) -> dict[str, Any] | None:
+    # latest results of another commit, results of current commit are overwritten on every run
+    candidates = [path for path in output_dir.glob('*.json') if path.stem != commit]
+    if not candidates:
+        return None
+    return json.loads(max(candidates, key=lambda path: path.stat().st_mtime).read_text())
+
+
+def _format_seconds(value: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if value >= scale:
+            return f'{value / scale:.2f}{unit}'
+    return f'{value / 1e-9:.0f}ns'
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmark failure reporting hot path')
+    parser.add_argument('names', nargs='*', help='benchmarks to run, all by default')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output-dir', type=Path, default=RESULTS_DIR,
+                        help='results are saved as <commit>.json here')
+    parser.add_argument('--compare', type=Path, default=None,
+                        help='results file to compare with, '
+                             'latest results of other commit by default')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='slowdown of per item cost reported as regression, 0.2 is 20%%')
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args(argv)
+
+    names = args.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f'unknown benchmarks: {", ".join(unknown)}, '
+                     f'available: {", ".join(BENCHMARKS)}')
+
+    commit = _git('rev-parse', 'HEAD') or 'unknown'
+    results: dict[str, Any] = {
+        'commit': commit,
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'benchmarks': {},
+    }
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    if args.compare:
+        previous = json.loads(args.compare.read_text())
+    else:
+        previous = _previous_results(args.output_dir, commit)
+    previous_benchmarks = previous['benchmarks'] if previous else {}
+    if previous is None:
+        print(f'No results of other commits in {args.output_dir}, '
+              'pass --compare <results.json> to compare')
+
+    regressions = []
+    with tempfile.TemporaryDirectory(prefix='flakyzavr-benchmarks-') as tests_dir:
+        for name in names:
+            measured = _measure(name, Path(tests_dir), args.repeat)
+            results['benchmarks'][name] = measured
+            line = f'{name:<38} {_format_seconds(measured["min"]):>10} per item'
+            baseline = previous_benchmarks.get(name)
+            if baseline:
+                change = measured['min'] / baseline['min'] - 1
+                line += f'  {change:+.1%} vs {previous["commit"][:10]}'
+                if change > args.threshold:
+                    regressions.append(name)
+                    line += '  REGRESSION'
+            print(line, flush=True)
+
+    output = args.output_dir / f'{commit}.json'
+    output.write_text(json.dumps(results, indent=2))
+    print(f'Results saved to {output}')
+    if regressions and args.fail_on_regression:
+        print(f'Regressions over {args.threshold:.0%}: {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from typing import Iterator
+
+from vedro import Scenario
+from vedro.core import ExcInfo
+from vedro.core import ScenarioResult
+from vedro.core import StepResult
+from vedro.core import VirtualScenario
+from vedro.core import VirtualStep
+
+from flakyzavr import FakeTracker
+from flakyzavr import Flakyzavr
+
+__all__ = ("make_traceback", "make_failed_result", "make_plugin_config", "JiraStub",
+           "iter_rel_paths",)
+
+SCENARIO_SOURCE = '''\
+def call(depth):
+    if depth == 0:
+        assert {"status": 500} == {"status": 200}, "Should be equal 200, 500 given"
+    return call(depth - 1)
+'''
+
+
+def make_traceback(tests_dir: Path, rel_path: str, depth: int) -> ExcInfo:
+    # real traceback with `depth` frames of scenario file,
+    # source is read by render_tb like in vedro run
+    path = tests_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(SCENARIO_SOURCE)
+    namespace: dict[str, Any] = {}
+    exec(compile(SCENARIO_SOURCE, str(path), 'exec'), namespace)
+    try:
+        namespace['call'](depth - 1)
+    except AssertionError as error:
+        assert error.__traceback__ is not None
+        # frame of benchmark itself is not part of scenario traceback
+        return ExcInfo(type(error), error, error.__traceback__.tb_next)
+    raise AssertionError('scenario source must fail')
+
+
+def make_failed_result(tests_dir: Path, rel_path: str, depth: int = 3) -> ScenarioResult:
+    exc_info = make_traceback(tests_dir, rel_path, depth)
+
+    class _Scenario(Scenario):
+        subject = f'benchmark {rel_path}'
+        __file__ = str(tests_dir / rel_path)
+
+    def step(self: Scenario) -> None:
+        ...
+
+    scenario_result = ScenarioResult(VirtualScenario(_Scenario, steps=[], project_dir=tests_dir))
+    step_result = StepResult(VirtualStep(step))
+    step_result.set_exc_info(exc_info)
+    scenario_result.add_step_result(step_result)
+    return scenario_result
+
+
+def make_plugin_config(tracker: FakeTracker, **options: Any) -> type[Flakyzavr]:
+    class _Flakyzavr(Flakyzavr):
+        enabled = True
+        jira_server = 'http://fake'
+        jira_project = 'BENCH'
+        report_project_name = 'Benchmark'
+        dry_run = False
+        exceptions = [r'.*codec can\'t decode byte.*']
+
+        def tracker_backend() -> FakeTracker:
+            return tracker
+
+    # config classes are frozen, options are set by subclassing
+    return type('_Flakyzavr', (_Flakyzavr,), options) if options else _Flakyzavr
+
+
+class _ServerInfoHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = json.dumps({'versionNumbers': [8, 13, 0]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class JiraStub:
+    # local http server answering serverInfo, enough for jira client to connect
+    def __init__(self) -> None:
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _ServerInfoHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+def iter_rel_paths(count: int) -> Iterator[str]:
+    for idx in range(count):
+        yield f'scenarios/benchmark_{idx}.py'
@@ -0,0 +1,126 @@
+import re
+from pathlib import Path
+from typing import Callable
+from typing import NamedTuple
+
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from flakyzavr import FakeTracker
+from flakyzavr import FlakyzavrPlugin
+from flakyzavr._exception_filter import ExceptionFilter
+from flakyzavr._jira_stdout import LazyJiraTrier
+from flakyzavr._traceback import render_tb
+
+from ._fixtures import JiraStub
+from ._fixtures import iter_rel_paths
+from ._fixtures import make_failed_result
+from ._fixtures import make_plugin_config
+from ._fixtures import make_traceback
+
+__all__ = ("Benchmark", "BENCHMARKS",)
+
+ERROR_TEXT = (
+    'AssertionError: Should be equal 200, 500 given\n'
+    '- {"status": 200, "body": {"id": 4815162342, "name": "order"}}\n'
+    '+ {"status": 500, "body": {"error": "upstream timed out"}}'
+)
+
+
+class Benchmark(NamedTuple):
+    # `run` is timed, cost is reported per one of `items` handled by it
+    run: Callable[[], object]
+    items: int = 1
+    close: Callable[[], None] | None = None
+
+
+BenchmarkFactory = Callable[[Path], Benchmark]
+BENCHMARKS: dict[str, BenchmarkFactory] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    def register(factory: BenchmarkFactory) -> BenchmarkFactory:
+        BENCHMARKS[name] = factory
+        return factory
+    return register
+
+
+def _render_tb(depth: int, max_frames: int | None = None) -> BenchmarkFactory:
+    def factory(tests_dir: Path) -> Benchmark:
+        rel_path = f'scenarios/render_tb_{depth}.py'
+        exc_info = make_traceback(tests_dir, rel_path, depth)
+        return Benchmark(lambda: render_tb(exc_info.traceback, rel_path, max_frames=max_frames))
+    return factory
+
+
+benchmark('render_tb_shallow')(_render_tb(depth=3))
+benchmark('render_tb_deep')(_render_tb(depth=200))
+benchmark('render_tb_deep_max_frames_20')(_render_tb(depth=200, max_frames=20))
+
+
+def _exception_patterns(count: int) -> list[str]:
+    return [
+        rf'.*service_{idx} returned status \d+ for request [0-9a-f]+.*' for idx in range(count)
+    ]
+
+
+def _exception_filter(patterns: int) -> BenchmarkFactory:
+    def factory(tests_dir: Path) -> Benchmark:
+        exception_filter = ExceptionFilter(_exception_patterns(patterns))
+        # failure not matching any pattern is the common and the most expensive case
+        return Benchmark(lambda: exception_filter.match(ERROR_TEXT))
+    return factory
+
+
+def _naive_exception_filter(patterns: int) -> BenchmarkFactory:
+    # re.search loop of patterns as it was done before ExceptionFilter, baseline for comparison
+    def factory(tests_dir: Path) -> Benchmark:
+        exception_patterns = _exception_patterns(patterns)
+
+        def run() -> bool:
+            return any(re.search(pattern, ERROR_TEXT) for pattern in exception_patterns)
+        return Benchmark(run)
+    return factory
+
+
+benchmark('exception_filter_10_patterns')(_exception_filter(10))
+benchmark('exception_filter_1000_patterns')(_exception_filter(1000))
+benchmark('exception_filter_10_patterns_naive')(_naive_exception_filter(10))
+benchmark('exception_filter_1000_patterns_naive')(_naive_exception_filter(1000))
+
+
+def _on_scenario_failed(failures: int) -> BenchmarkFactory:
+    # every failure is of its own scenario file,
+    # so each one searches and creates issue in fake tracker
+    def factory(tests_dir: Path) -> Benchmark:
+        events = [
+            ScenarioFailedEvent(scenario_result=make_failed_result(tests_dir, rel_path))
+            for rel_path in iter_rel_paths(failures)
+        ]
+
+        def run() -> None:
+            plugin = FlakyzavrPlugin(config=make_plugin_config(FakeTracker()))
+            for event in events:
+                plugin.on_scenario_failed(event)
+                event.scenario_result.extra_details.clear()
+            plugin.on_cleanup(CleanupEvent(Report()))
+        return Benchmark(run, items=failures)
+    return factory
+
+
+benchmark('on_scenario_failed_1')(_on_scenario_failed(1))
+benchmark('on_scenario_failed_100')(_on_scenario_failed(100))
+benchmark('on_scenario_failed_1000')(_on_scenario_failed(1000))
+
+
+@benchmark('jira_connect')
+def _jira_connect(tests_dir: Path) -> Benchmark:
+    stub = JiraStub()
+    stub.start()
+
+    def run() -> None:
+        jira = LazyJiraTrier(stub.url, token='token')
+        jira.connect()
+        jira.close()
+    return Benchmark(run, close=stub.stop)
@@ -1,12 +1,15 @@
 from flakyzavr.version import get_version
+from ._fake_tracker import FakeTracker
 from ._flakyzavr_plugin import Flakyzavr
 from ._flakyzavr_plugin import FlakyzavrPlugin
 from ._messages import EN_REPORTING_LANG
 from ._messages import RU_REPORTING_LANG
 from ._messages import ReportingLangSet
+from ._tracker_backend import TrackerBackend
 
 __version__ = get_version()
 __all__ = (
     "Flakyzavr", "FlakyzavrPlugin",
-    "ReportingLangSet", "RU_REPORTING_LANG", "EN_REPORTING_LANG"
+    "ReportingLangSet", "RU_REPORTING_LANG", "EN_REPORTING_LANG",
+    "TrackerBackend", "FakeTracker",
 )
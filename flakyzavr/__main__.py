@@ -0,0 +1,6 @@
+import sys
+
+from flakyzavr._cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import argparse
+import importlib.util
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+from typing import Type
+
+from flakyzavr._failure import Failure
+from flakyzavr._failure import unique_failures
+from flakyzavr._flakyzavr_plugin import Flakyzavr
+from flakyzavr._flakyzavr_plugin import FlakyzavrPlugin
+from flakyzavr._rate_limit import RateLimiter
+from flakyzavr._result_readers import read_results
+from flakyzavr._shards import ShardStore
+from flakyzavr._spool import FailureSpool
+from flakyzavr._spool import read_failures
+
+__all__ = ("main", "load_config", "report_in_bulk",)
+
+
+def load_config(path: str) -> Type[Flakyzavr]:
+    config_path = Path(path).resolve()
+    if not config_path.exists():
+        raise SystemExit(f'Config {path} is not found')
+    # vedro.cfg.py imports project modules relative to its directory
+    sys.path.insert(0, str(config_path.parent))
+    spec = importlib.util.spec_from_file_location('_flakyzavr_vedro_cfg', config_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    plugins = getattr(getattr(module, 'Config', None), 'Plugins', None)
+    for name in dir(plugins):
+        value = getattr(plugins, name)
+        if isinstance(value, type) and issubclass(value, Flakyzavr) and value is not Flakyzavr:
+            return value
+    raise SystemExit(f'Flakyzavr plugin config is not found in {path}')
+
+
+def report_in_bulk(plugin: FlakyzavrPlugin, failures: list[Failure], workers: int,
+                   rate: float | None = None) -> None:
+    plugin.start()
+    try:
+        # same-error clusters become mass failure issues like on cleanup of a run
+        failures = plugin.report_mass_failures(unique_failures(failures), print)
+        _report_grouped(plugin, failures, workers, rate)
+    finally:
+        plugin.finish(print)
+
+
+def _report_grouped(plugin: FlakyzavrPlugin, failures: list[Failure], workers: int,
+                    rate: float | None) -> None:
+    # failures of one issue go to one worker, so it is searched once and others reuse it
+    groups: dict[str, list[Failure]] = {}
+    for failure in failures:
+        groups.setdefault(plugin.lookup_key(failure), []).append(failure)
+    batch_size = max(plugin.search_batch_size, 1)
+    grouped = list(groups.values())
+    batches = [
+        [failure for group in grouped[offset:offset + batch_size] for failure in group]
+        for offset in range(0, len(grouped), batch_size)
+    ]
+
+    limiter = RateLimiter(rate, burst=workers) if rate else None
+
+    def report(batch: list[Failure]) -> None:
+        if limiter:
+            limiter.acquire()
+        plugin.report_failures(batch)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(report, batches))
+
+
+def replay(args: argparse.Namespace) -> int:
+    config = load_config(args.config)
+    spool_path = args.spool or config.spool_path
+    if not spool_path:
+        print('Spool path is not set, pass --spool or set Flakyzavr.spool_path')
+        return 2
+
+    claimed = FailureSpool(spool_path).claim()
+    if claimed is None:
+        print(f'Nothing to replay in {spool_path}')
+        return 0
+    failures = read_failures(claimed)
+    print(f'Replaying {len(failures)} failures from {spool_path}')
+
+    # failures that can not be reported again are spooled by plugin to a fresh spool file
+    replay_config = type('ReplayFlakyzavr', (config,), {
+        'shard_dir': None,
+        'spool_path': spool_path,
+        'spool_only': False,
+        'report_async': False,
+    })
+    report_in_bulk(FlakyzavrPlugin(config=replay_config), failures,
+                   workers=args.workers, rate=args.rate)
+    claimed.unlink()
+    return 0
+
+
+def report(args: argparse.Namespace) -> int:
+    config = load_config(args.config)
+    job_link = args.job_link or config.job_path.format(job_id=config.job_id)
+    failures = [failure for path in args.results
+                for failure in read_results(path, job_link, args.format)]
+
+    plugin = FlakyzavrPlugin(config=type('BulkFlakyzavr', (config,), {
+        'shard_dir': None,
+        'spool_only': False,
+        'report_async': False,
+    }))
+    failures = [failure for failure in failures
+                if not plugin.is_filtered_out(failure.error_message)]
+    print(f'Reporting {len(failures)} failures from {", ".join(args.results)}')
+    report_in_bulk(plugin, failures, workers=args.workers, rate=args.rate)
+    return 0
+
+
+def aggregate(args: argparse.Namespace) -> int:
+    config = load_config(args.config)
+    shard_dir = args.shard_dir or config.shard_dir
+    if not shard_dir:
+        print('Shard directory is not set, pass --shard-dir or set Flakyzavr.shard_dir')
+        return 2
+
+    store = ShardStore(shard_dir, shard_id='aggregate')
+    failures, claimed = store.read_all()
+    print(f'Aggregating {len(failures)} failures from {len(claimed)} shards in {shard_dir}')
+
+    aggregate_config = type('AggregateFlakyzavr', (config,), {
+        'shard_dir': None,
+        'spool_only': False,
+        'report_async': False,
+    })
+    report_in_bulk(FlakyzavrPlugin(config=aggregate_config), failures,
+                   workers=args.workers, rate=args.rate)
+    store.cleanup(claimed)
+    return 0
+
+
+COMMANDS: dict[str, Callable[[argparse.Namespace], int]] = {
+    'replay': replay,
+    'report': report,
+    'aggregate': aggregate,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='flakyzavr', description='Report flaky tests to Jira')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    replay_parser = commands.add_parser(
+        'replay', help='report failures saved to spool while jira was unavailable'
+    )
+    replay_parser.add_argument('--config', default='vedro.cfg.py',
+                               help='vedro config with Flakyzavr plugin')
+    replay_parser.add_argument('--spool', default=None,
+                               help='spool file, Flakyzavr.spool_path by default')
+    replay_parser.add_argument('--workers', type=int, default=4)
+    replay_parser.add_argument('--rate', type=float, default=None, help='max reports per second')
+
+    report_parser = commands.add_parser('report', help='report failures from saved test results')
+    report_parser.add_argument('results', nargs='+',
+                               help='allure-results directory, vedro json report '
+                                    'or flakyzavr spool')
+    report_parser.add_argument('--format', default='auto',
+                               choices=['auto', 'allure', 'vedro-json', 'spool'])
+    report_parser.add_argument('--config', default='vedro.cfg.py',
+                               help='vedro config with Flakyzavr plugin')
+    report_parser.add_argument('--job-link', default=None,
+                               help='Flakyzavr.job_path with job_id by default')
+    report_parser.add_argument('--workers', type=int, default=4)
+    report_parser.add_argument('--rate', type=float, default=None, help='max reports per second')
+
+    aggregate_parser = commands.add_parser('aggregate',
+                                           help='report failures written by shards once')
+    aggregate_parser.add_argument('--config', default='vedro.cfg.py',
+                                  help='vedro config with Flakyzavr plugin')
+    aggregate_parser.add_argument('--shard-dir', default=None,
+                                  help='Flakyzavr.shard_dir by default')
+    aggregate_parser.add_argument('--workers', type=int, default=4)
+    aggregate_parser.add_argument('--rate', type=float, default=None,
+                                  help='max reports per second')
+
+    args = parser.parse_args(argv)
+    return COMMANDS[args.command](args)
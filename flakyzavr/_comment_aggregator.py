@@ -0,0 +1,57 @@
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from flakyzavr._failure import Failure
+
+__all__ = ("CommentAggregator", "AggregatedComment", "AggregatedFailure",)
+
+
+@dataclass
+class AggregatedFailure:
+    error: str
+    traceback: str
+    test_file: str
+    priority: str
+    count: int = 0
+    test_names: list[str] = field(default_factory=list)
+
+
+@dataclass
+class AggregatedComment:
+    issue: Any
+    lookup_keys: set[str] = field(default_factory=set)
+    failures: dict[str, AggregatedFailure] = field(default_factory=dict)
+    records: list[Failure] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return sum(failure.count for failure in self.failures.values())
+
+
+class CommentAggregator:
+    def __init__(self) -> None:
+        self._comments: dict[str, AggregatedComment] = {}
+        self._lock = threading.Lock()
+
+    def add(self, issue: Any, lookup_key: str, failure: Failure) -> None:
+        with self._lock:
+            comment = self._comments.setdefault(issue.key, AggregatedComment(issue=issue))
+            comment.lookup_keys.add(lookup_key)
+            comment.records.append(failure)
+            # only first traceback of each fingerprint gets into comment
+            aggregated = comment.failures.get(failure.fingerprint)
+            if aggregated is None:
+                aggregated = AggregatedFailure(error=failure.error, traceback=failure.traceback,
+                                               test_file=failure.test_file,
+                                               priority=failure.priority)
+                comment.failures[failure.fingerprint] = aggregated
+            aggregated.count += 1
+            if failure.test_name not in aggregated.test_names:
+                aggregated.test_names.append(failure.test_name)
+
+    def pop_all(self) -> list[AggregatedComment]:
+        with self._lock:
+            comments, self._comments = list(self._comments.values()), {}
+        return comments
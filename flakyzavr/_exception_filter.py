@@ -0,0 +1,73 @@
+import re
+from collections import deque
+
+__all__ = ("ExceptionFilter",)
+
+
+class SubstringMatcher:
+    # Aho-Corasick automaton: one pass over text for any number of substrings
+    def __init__(self, substrings: list[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[str | None] = [None]
+        for substring in substrings:
+            if substring:
+                self._add(substring)
+        self._build_fail_links()
+
+    def _add(self, substring: str) -> None:
+        node = 0
+        for char in substring:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+                self._goto[node][char] = next_node
+            node = next_node
+        if self._out[node] is None:
+            self._out[node] = substring
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_node] = self._goto[fail].get(char, 0)
+                if self._out[next_node] is None:
+                    self._out[next_node] = self._out[self._fail[next_node]]
+                queue.append(next_node)
+
+    def search(self, text: str) -> str | None:
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node] is not None:
+                return out[node]
+        return None
+
+
+class ExceptionFilter:
+    # patterns are compiled once and tried in order, one alternation of all of them is much slower:
+    # re tries every branch at every position and loses literal prefix scan of each pattern
+    def __init__(self, patterns: list[str], substrings: list[str] | None = None) -> None:
+        self._regexps = [(pattern, re.compile(pattern)) for pattern in patterns]
+        self._substrings = SubstringMatcher(substrings) if substrings else None
+
+    def match(self, text: str) -> str | None:
+        if self._substrings:
+            substring = self._substrings.search(text)
+            if substring is not None:
+                return substring
+
+        for pattern, regexp in self._regexps:
+            if regexp.search(text):
+                return pattern
+        return None
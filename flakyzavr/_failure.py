@@ -0,0 +1,52 @@
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from time import time
+from typing import Callable
+
+__all__ = ("Failure", "unique_failures",)
+
+
+@dataclass
+class Failure:
+    test_name: str
+    test_file: str
+    priority: str
+    error: str
+    error_type: str
+    error_signature: str
+    traceback: str
+    fingerprint: str
+    job_link: str
+    # message alone, without error type, is matched by exceptions filter
+    error_message: str = ''
+    failed_at: float = field(default_factory=time)
+    # vedro reruns of scenario, set when reporting after reruns
+    attempts: int = 1
+    failed_attempts: int = 1
+    # where reporting outcome goes: scenario extra details during run, stdout on replay
+    add_extra_details: Callable[[str], None] = field(default=print, repr=False, compare=False)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {item.name: getattr(self, item.name) for item in fields(self) if item.compare},
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "Failure":
+        data = json.loads(line)
+        return cls(**{
+            item.name: data[item.name]
+            for item in fields(cls) if item.compare and item.name in data
+        })
+
+
+def unique_failures(failures: list[Failure]) -> list[Failure]:
+    # same failure saved by several reporters or shards is reported once
+    unique: dict[tuple[str, str, str, str], Failure] = {}
+    for failure in failures:
+        key = (failure.test_file, failure.test_name, failure.fingerprint, failure.job_link)
+        unique.setdefault(key, failure)
+    return list(unique.values())
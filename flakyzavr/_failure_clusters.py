@@ -0,0 +1,11 @@
+from flakyzavr._failure import Failure
+
+__all__ = ("cluster_failures",)
+
+
+def cluster_failures(failures: list[Failure]) -> dict[str, list[Failure]]:
+    # failures with same error type and masked message share a root cause wherever they happened
+    clusters: dict[str, list[Failure]] = {}
+    for failure in failures:
+        clusters.setdefault(failure.error_signature, []).append(failure)
+    return clusters
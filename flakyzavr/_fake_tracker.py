@@ -0,0 +1,161 @@
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+from typing import Callable
+
+from flakyzavr._jira_stdout import JiraIssueNotFound
+from flakyzavr._jira_stdout import JiraIssueRejected
+from flakyzavr._jira_stdout import JiraUnavailable
+
+__all__ = ("FakeTracker",)
+
+JQL_PROJECT = re.compile(r'project = (\S+)')
+JQL_DESCRIPTION = re.compile(r'description ~ "\\"(.*?)\\""')
+JQL_LABELS_IN = re.compile(r'labels in \(([^)]*)\)')
+JQL_LABEL = re.compile(r'labels = (\S+)')
+JQL_STATUSES = re.compile(r'status in \(([^)]*)\)')
+
+
+def _jql_list(value: str) -> list[str]:
+    return [item.strip().strip('"') for item in value.split(',') if item.strip()]
+
+
+class FakeTracker:
+    # in-memory tracker understanding jql built by plugin,
+    # for benchmarks and load tests without network; every call sleeps `latency`
+    # and fails with `error_rate` probability or always for `failing_operations`
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0,
+                 failing_operations: tuple[str, ...] = (), seed: int = 0, status: str = 'Open',
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self._latency = latency
+        self._error_rate = error_rate
+        self._failing_operations = set(failing_operations)
+        self._random = random.Random(seed)
+        self._status = status
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._connections_opened = 0
+        self.issues: dict[str, SimpleNamespace] = {}
+        self.comments: dict[str, list[str]] = {}
+        self.links: list[tuple[str, str]] = []
+        self.attachments: dict[str, list[tuple[str, bytes]]] = {}
+        self.calls: dict[str, int] = {}
+
+    @property
+    def connections_opened(self) -> int:
+        return self._connections_opened
+
+    def _enter(self, operation: str) -> bool:
+        if self._latency:
+            self._sleep(self._latency)
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            failed = self._error_rate and self._random.random() < self._error_rate
+        return not failed and operation not in self._failing_operations
+
+    def connect(self) -> "FakeTracker | JiraUnavailable":
+        if not self._enter('connect'):
+            return JiraUnavailable()
+        if not self._connections_opened:
+            self._connections_opened = 1
+        return self
+
+    def close(self) -> None:
+        pass
+
+    def _compile_query(self, jql_str: str) -> Callable[[SimpleNamespace], bool]:
+        # query is parsed once per search, not once per stored issue
+        project = JQL_PROJECT.search(jql_str)
+        statuses = JQL_STATUSES.search(jql_str)
+        status_names = set(_jql_list(statuses.group(1))) if statuses else None
+        labels = JQL_LABEL.findall(jql_str)
+        labels_in = JQL_LABELS_IN.search(jql_str)
+        any_labels = set(_jql_list(labels_in.group(1))) if labels_in else None
+        phrases = JQL_DESCRIPTION.findall(jql_str)
+
+        def matches(issue: SimpleNamespace) -> bool:
+            fields = issue.fields
+            if project and fields.project != project.group(1):
+                return False
+            if status_names is not None and fields.status.name not in status_names:
+                return False
+            if any(label not in fields.labels for label in labels):
+                return False
+            if any_labels is not None and not any_labels.intersection(fields.labels):
+                return False
+            if phrases and not any(phrase in fields.description for phrase in phrases):
+                return False
+            return True
+        return matches
+
+    def search_issues(self, jql_str: str, max_results: int | bool = 50,
+                      fields: str = '*all') -> list[SimpleNamespace] | JiraUnavailable:
+        if not self._enter('search'):
+            return JiraUnavailable()
+        matches = self._compile_query(jql_str)
+        with self._lock:
+            found = [issue for issue in self.issues.values() if matches(issue)]
+        if max_results is not False:
+            found = found[:int(max_results)]
+        return found
+
+    def issue(self, key: str, fields: str = '*all') -> SimpleNamespace | JiraUnavailable:
+        if not self._enter('issue'):
+            return JiraUnavailable()
+        issue = self.issues.get(key)
+        if issue is None:
+            return JiraIssueNotFound()
+        return issue
+
+    def add_comment(self, issue: Any, comment: str) -> None | JiraUnavailable:
+        if not self._enter('comment'):
+            return JiraUnavailable()
+        if issue.key not in self.issues:
+            return JiraIssueNotFound()
+        with self._lock:
+            self.comments.setdefault(issue.key, []).append(comment)
+        return None
+
+    def _create(self, fields: dict[str, Any]) -> SimpleNamespace | JiraUnavailable:
+        if not fields.get('summary'):
+            return JiraIssueRejected({'summary': 'You must specify a summary of the issue.'})
+        with self._lock:
+            project = fields['project']['key']
+            key = f'{project}-{len(self.issues) + 1}'
+            issue = SimpleNamespace(key=key, fields=SimpleNamespace(
+                project=project,
+                summary=fields['summary'],
+                description=fields.get('description') or '',
+                labels=list(fields.get('labels') or []),
+                status=SimpleNamespace(name=self._status),
+            ))
+            self.issues[key] = issue
+        return issue
+
+    def create_issue(self, fields: dict[str, Any]) -> SimpleNamespace | JiraUnavailable:
+        if not self._enter('create'):
+            return JiraUnavailable()
+        return self._create(fields)
+
+    def create_issues(self,
+                      field_list: list[dict[str, Any]]) -> list[SimpleNamespace | JiraUnavailable]:
+        if not self._enter('create_bulk'):
+            return [JiraUnavailable() for _ in field_list]
+        return [self._create(fields) for fields in field_list]
+
+    def create_issue_link(self, inwardIssue: str, outwardIssue: str) -> None | JiraUnavailable:
+        if not self._enter('link'):
+            return JiraUnavailable()
+        with self._lock:
+            self.links.append((inwardIssue, outwardIssue))
+        return None
+
+    def add_attachment(self, issue: Any, filename: str, content: bytes) -> None | JiraUnavailable:
+        if not self._enter('attachment'):
+            return JiraUnavailable()
+        with self._lock:
+            self.attachments.setdefault(issue.key, []).append((filename, content))
+        return None
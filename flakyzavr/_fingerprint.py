@@ -0,0 +1,57 @@
+import hashlib
+import re
+from typing import Any
+
+from flakyzavr._traceback import _get_lines
+
+__all__ = ("failure_fingerprint", "signature_fingerprint", "signature_hash", "error_signature",
+           "text_error_signature", "normalize_message", "source_line",)
+
+MESSAGE_MASKS = (
+    (re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'),
+     '<uuid>'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?'),
+     '<ts>'),
+    (re.compile(r'0x[0-9a-fA-F]+'), '<hex>'),
+    (re.compile(r'\d+(?:\.\d+)?'), '<n>'),
+)
+
+
+def normalize_message(message: str) -> str:
+    for regexp, mask in MESSAGE_MASKS:
+        message = regexp.sub(mask, message)
+    return message
+
+
+def source_line(filename: str, lineno: int) -> str:
+    try:
+        lines = _get_lines(filename)
+    except OSError:
+        return str(lineno)
+    # line text survives edits above the failed step, line number does not
+    if 0 < lineno <= len(lines):
+        return lines[lineno - 1].strip()
+    return str(lineno)
+
+
+def error_signature(error: Any) -> str:
+    return text_error_signature(type(error).__qualname__, str(error))
+
+
+def text_error_signature(error_type: str, message: str) -> str:
+    return f'{error_type}\n{normalize_message(message)}'
+
+
+def failure_fingerprint(error: Any, test_file: str, step_name: str) -> str:
+    return signature_fingerprint(error_signature(error), test_file, step_name)
+
+
+def signature_fingerprint(signature: str, test_file: str, step_name: str) -> str:
+    # failed step is known to live results, vedro json reports and allure traces alike,
+    # while line of scenario frame is lost in json report
+    # when error is raised outside scenario file
+    return hashlib.sha1('\n'.join([signature, test_file, step_name]).encode()).hexdigest()[:12]
+
+
+def signature_hash(signature: str) -> str:
+    return hashlib.sha1(signature.encode()).hexdigest()[:12]
@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+__all__ = ("FlakyHistory",)
+
+PASSED = 'P'
+FAILED = 'F'
+
+
+class FlakyHistory:
+    # outcomes of last `window` runs per scenario as a string like 'PPFP', newest last;
+    # outcomes of current run are kept in memory and merged into the file once on save
+    def __init__(self, path: str | Path, window: int) -> None:
+        self._path = Path(path)
+        self._window = window
+        self._stored: dict[str, str] | None = None
+        self._run_outcomes: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS outcomes '
+            '(scenario_id TEXT PRIMARY KEY, outcomes TEXT NOT NULL)'
+        )
+        return connection
+
+    def _load(self) -> dict[str, str]:
+        if self._stored is None:
+            connection = self._connect()
+            try:
+                rows = connection.execute('SELECT scenario_id, outcomes FROM outcomes')
+                self._stored = dict(rows)
+            finally:
+                connection.close()
+        return self._stored
+
+    def record(self, scenario_id: str, passed: bool) -> None:
+        with self._lock:
+            outcomes = self._run_outcomes.get(scenario_id, '')
+            self._run_outcomes[scenario_id] = outcomes + (PASSED if passed else FAILED)
+
+    def fail_rate(self, scenario_id: str) -> tuple[int, int]:
+        with self._lock:
+            stored = self._load().get(scenario_id, '')
+            outcomes = (stored + self._run_outcomes.get(scenario_id, ''))[-self._window:]
+        return outcomes.count(FAILED), len(outcomes)
+
+    def save(self) -> None:
+        with self._lock:
+            run_outcomes, self._run_outcomes = self._run_outcomes, {}
+        if not run_outcomes:
+            return
+        connection = self._connect()
+        try:
+            # parallel jobs share the file,
+            # outcomes are appended to what is stored at the moment of save
+            connection.execute('BEGIN IMMEDIATE')
+            for scenario_id, outcomes in run_outcomes.items():
+                row = connection.execute(
+                    'SELECT outcomes FROM outcomes WHERE scenario_id = ?', (scenario_id,)
+                ).fetchone()
+                merged = ((row[0] if row else '') + outcomes)[-self._window:]
+                connection.execute(
+                    'INSERT INTO outcomes (scenario_id, outcomes) VALUES (?, ?) '
+                    'ON CONFLICT(scenario_id) DO UPDATE SET outcomes = excluded.outcomes',
+                    (scenario_id, merged),
+                )
+            connection.execute('COMMIT')
+        finally:
+            connection.close()
+        self._stored = None
@@ -1,25 +1,79 @@
+import gzip
+import os
 import re
+import socket
+import threading
+from contextlib import ExitStack
+from time import monotonic
+from types import TracebackType
+from typing import Any
+from typing import Callable
 from typing import Type
 from typing import Union
 
-from jira import JIRA
+from jira import Issue
 from vedro.core import Dispatcher
 from vedro.core import Plugin
 from vedro.core import PluginConfig
 from vedro.core import ScenarioResult
 from vedro.core import VirtualScenario
+from vedro.events import CleanupEvent
 from vedro.events import ScenarioFailedEvent
 from vedro.events import ScenarioPassedEvent
+from vedro.events import ScenarioReportedEvent
+from vedro.events import StartupEvent
 
+from flakyzavr._circuit_breaker import CircuitBreaker
+from flakyzavr._comment_aggregator import AggregatedComment
+from flakyzavr._comment_aggregator import CommentAggregator
+from flakyzavr._exception_filter import ExceptionFilter
+from flakyzavr._failure import Failure
+from flakyzavr._failure import unique_failures
+from flakyzavr._failure_clusters import cluster_failures
+from flakyzavr._fingerprint import error_signature
+from flakyzavr._fingerprint import failure_fingerprint
+from flakyzavr._fingerprint import signature_hash
+from flakyzavr._flaky_history import FlakyHistory
+from flakyzavr._issue_cache import IssueCache
+from flakyzavr._jira_stdout import JiraIssueNotFound
+from flakyzavr._jira_stdout import JiraIssueRejected
 from flakyzavr._jira_stdout import JiraUnavailable
 from flakyzavr._jira_stdout import LazyJiraTrier
 from flakyzavr._messages import RU_REPORTING_LANG
 from flakyzavr._messages import ReportingLangSet
+from flakyzavr._payload_budget import truncate_text
+from flakyzavr._payload_budget import truncate_traceback
+from flakyzavr._report_queue import ReportQueue
+from flakyzavr._run_stats import RunStats
+from flakyzavr._scenario_metadata import ScenarioMetadataCache
+from flakyzavr._shards import ShardStore
+from flakyzavr._spool import FailureSpool
+from flakyzavr._throttle import JiraThrottle
 from flakyzavr._traceback import render_error
 from flakyzavr._traceback import render_tb
+from flakyzavr._tracker_backend import TrackerBackend
 
 __all__ = ("Flakyzavr", "FlakyzavrPlugin",)
 
+# test file path is written on a separate line of issue description
+TEST_FILE_IN_DESCRIPTION = re.compile(r'^\s*([^\s#|:]+\.py)\s*$', re.MULTILINE)
+# traceback frames are headed by absolute file path, the only place of test file in EN descriptions
+TRACEBACK_FILE_IN_DESCRIPTION = re.compile(r'^# (\S+\.py):$', re.MULTILINE)
+
+
+def _description_test_files(description: str) -> list[str]:
+    test_files = TEST_FILE_IN_DESCRIPTION.findall(description)
+    for path in TRACEBACK_FILE_IN_DESCRIPTION.findall(description):
+        # every path suffix is a candidate, `description ~ "{test_file}"` matches any of them
+        parts = path.strip('/').split('/')
+        test_files.extend('/'.join(parts[idx:]) for idx in range(len(parts)))
+    return test_files
+
+
+def _issue_status(issue: Issue) -> str:
+    status = getattr(getattr(issue, 'fields', None), 'status', None)
+    return getattr(status, 'name', '')
+
 
 class FlakyzavrPlugin(Plugin):
     def __init__(self, config: Type["Flakyzavr"]) -> None:
@@ -31,23 +85,299 @@ class FlakyzavrPlugin(Plugin):
         self._jira_project = config.jira_project
         self._jira_labels = config.jira_labels
         self._jira_components = config.jira_components
-        self._jira: JIRA | LazyJiraTrier | None = None
         self._report_project_name = config.report_project_name
         self._job_path = config.job_path
         self._job_id = config.job_id
         self._job_full_path = config.job_path.format(job_id=config.job_id)
         self._dry_run = config.dry_run
         self._jira_search_statuses = config.jira_search_statuses
-        self._exceptions = config.exceptions
+        self._exception_filter = ExceptionFilter(config.exceptions, config.exceptions_substrings)
         self._jira_search_forbidden_symbols = config.jira_search_forbidden_symbols
         self._jira_flaky_label = config.jira_flaky_label
         self._reporting_language = config.reporting_language
         self._jira_additional_data = config.jira_additional_data
         self._jira_issue_type_id = config.jira_issue_type_id
+        circuit_breaker = None
+        if config.jira_circuit_breaker_threshold:
+            circuit_breaker = CircuitBreaker(
+                failure_threshold=config.jira_circuit_breaker_threshold,
+                cooldown=config.jira_circuit_breaker_cooldown,
+            )
+        self._stats = RunStats()
+        self._scenario_metadata = ScenarioMetadataCache()
+        self._flaky_history: FlakyHistory | None = None
+        if config.flaky_history_path:
+            self._flaky_history = FlakyHistory(config.flaky_history_path,
+                                               window=config.flaky_history_window)
+        self._flaky_min_fail_rate = config.flaky_min_fail_rate
+        self._flaky_history_min_runs = config.flaky_history_min_runs
+        self._report_after_reruns = config.report_after_reruns
+        self._run_stats_enabled = config.run_stats
+        self._run_stats_json_path = config.run_stats_json_path
+        self._run_stats_prometheus_path = config.run_stats_prometheus_path
+        self._throttle: JiraThrottle | None = None
+        if config.jira_write_rate or config.jira_write_concurrency:
+            self._throttle = JiraThrottle(
+                rate=config.jira_write_rate,
+                burst=config.jira_write_burst,
+                concurrency=config.jira_write_concurrency,
+                retries=config.jira_throttle_retries,
+                max_retry_after=config.jira_retry_after_max,
+            )
+        self._jira: TrackerBackend
+        if config.tracker_backend is not None:
+            self._jira = config.tracker_backend()
+        else:
+            self._jira = LazyJiraTrier(
+                self._jira_server,
+                token=self._jira_token,
+                dry_run=self._dry_run,
+                pool_size=config.jira_pool_size,
+                circuit_breaker=circuit_breaker,
+                throttle=self._throttle,
+                stats=self._stats,
+            )
+        self._jira_search_batch_size = config.jira_search_batch_size
+        self._jira_bulk_create_size = config.jira_bulk_create_size
+        self._jira_prefetch_issues = config.jira_prefetch_issues
+        self._jira_fingerprint_search = config.jira_fingerprint_search
+        self._jira_fingerprint_label_prefix = config.jira_fingerprint_label_prefix
+        # issues are keyed by test file or by fingerprint label in fingerprint search mode
+        self._issue_index: dict[str, Issue] = {}
+        # issues found or created during current run
+        self._run_issues: dict[str, Issue] = {}
+        self._lookup_locks: dict[str, threading.Lock] = {}
+        self._lookup_locks_lock = threading.Lock()
+        self._issue_cache: IssueCache | None = None
+        if config.jira_issue_cache_path:
+            self._issue_cache = IssueCache(config.jira_issue_cache_path,
+                                           ttl=config.jira_issue_cache_ttl)
+        self._search_batch: list[Failure] = []
+        self._mass_failure_threshold = config.mass_failure_threshold
+        self._jira_mass_failure_label = config.jira_mass_failure_label
+        # failures kept until cleanup to be clustered by error
+        self._deferred_failures: list[Failure] = []
+        self._comment_aggregator: CommentAggregator | None = None
+        if config.jira_aggregate_comments:
+            self._comment_aggregator = CommentAggregator()
+        if config.traceback_max_frames is not None and config.traceback_max_frames < 1:
+            # frame where error was raised is always rendered
+            raise ValueError(
+                f'traceback_max_frames must be at least 1, got {config.traceback_max_frames}'
+            )
+        self._traceback_max_frames = config.traceback_max_frames
+        self._traceback_skip_paths = tuple(config.traceback_skip_paths)
+        self._report_flush_timeout = config.report_flush_timeout
+        self._traceback_max_bytes = config.jira_traceback_max_bytes
+        self._error_max_bytes = config.jira_error_max_bytes
+        self._attach_truncated = config.jira_attach_truncated
+        # (issue key, fingerprint) of full failures already attached during run
+        self._attached: set[tuple[str, str]] = set()
+        self._attached_lock = threading.Lock()
+        self._spool: FailureSpool | None = None
+        if config.spool_path:
+            self._spool = FailureSpool(config.spool_path)
+        self._spool_only = config.spool_only
+        self._shards: ShardStore | None = None
+        if config.shard_dir:
+            shard_id = config.shard_id or f'{socket.gethostname()}-{os.getpid()}'
+            self._shards = ShardStore(config.shard_dir, shard_id)
+        self._shard_count = config.shard_count
+        self._report_queue: ReportQueue | None = None
+        if config.report_async:
+            self._report_queue = ReportQueue(
+                self.report_failures,
+                maxsize=config.report_queue_size,
+                workers=config.report_workers,
+            )
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         if self._report_enabled:
-            dispatcher.listen(ScenarioFailedEvent, self.on_scenario_failed)
+            dispatcher.listen(StartupEvent, self.on_startup)
+            if self._report_after_reruns:
+                dispatcher.listen(ScenarioReportedEvent, self.on_scenario_reported)
+            else:
+                dispatcher.listen(ScenarioFailedEvent, self.on_scenario_failed)
+                if self._flaky_history:
+                    dispatcher.listen(ScenarioPassedEvent, self.on_scenario_passed)
+            dispatcher.listen(CleanupEvent, self.on_cleanup)
+
+    def on_startup(self, event: StartupEvent) -> None:
+        self.start()
+
+    def on_cleanup(self, event: CleanupEvent) -> None:
+        self.finish(event.report.add_summary)
+
+    def on_scenario_passed(self, event: ScenarioPassedEvent) -> None:
+        self._record_outcomes(event.scenario_result.scenario.unique_id, [True])
+
+    def on_scenario_reported(self, event: ScenarioReportedEvent) -> None:
+        aggregated_result = event.aggregated_result
+        attempts = aggregated_result.scenario_results or [aggregated_result]
+        outcomes = [result.is_passed() for result in attempts
+                    if result.is_passed() or result.is_failed()]
+        failed_attempts = [result for result in attempts if result.is_failed()]
+        if not failed_attempts:
+            self._record_outcomes(aggregated_result.scenario.unique_id, outcomes)
+            return
+        # error of the last failed attempt is reported, details go to the result shown by reporters
+        self._handle_failed_result(failed_attempts[-1], aggregated_result.add_extra_details,
+                                   outcomes)
+
+    def _record_outcomes(self, scenario_id: str, outcomes: list[bool]) -> None:
+        if self._flaky_history:
+            for passed in outcomes:
+                self._flaky_history.record(scenario_id, passed=passed)
+
+    def start(self) -> None:
+        if self._spool_only or self._shards:
+            return
+        self._start_reporting()
+
+    def _start_reporting(self) -> None:
+        self._jira.connect()
+        if self._issue_cache:
+            self._issue_cache.load()
+        if self._jira_prefetch_issues:
+            self._prefetch_issue_index()
+        if self._report_queue:
+            self._report_queue.start()
+
+    def finish(self, add_summary: Callable[[str], None]) -> None:
+        if self._shards:
+            self._aggregate_shards(add_summary)
+        self._report_deferred_failures(add_summary)
+        self._flush_search_batch()
+        if self._report_queue:
+            deadline = monotonic() + self._report_flush_timeout
+            pending = self._report_queue.flush(self._report_flush_timeout)
+            # failures already handed to workers are reported before jira client is closed,
+            # unless they are still in progress at deadline
+            pending += self._report_queue.stop(max(deadline - monotonic(), 0))
+            for failure in pending:
+                add_summary(self._reporting_language.REPORT_PENDING.format(
+                    jira_server=self._jira_server,
+                    test_file=failure.test_file,
+                ))
+            self._spool_failures(pending)
+        if self._comment_aggregator:
+            for comment in self._comment_aggregator.pop_all():
+                self._add_aggregated_comment(comment, add_summary)
+        self._report_run_stats()
+        if self._flaky_history:
+            self._flaky_history.save()
+        self._jira.close()
+
+    def _aggregate_shards(self, add_summary: Callable[[str], None]) -> None:
+        assert self._shards
+        # last finished shard reports failures of all shards,
+        # without shard_count it is left to `flakyzavr aggregate`
+        done_count = self._shards.mark_done()
+        if not self._shard_count or done_count < self._shard_count:
+            return
+        if not self._shards.acquire_aggregation():
+            return
+
+        failures, claimed = self._shards.read_all()
+        self._start_reporting()
+        if self._mass_failure_threshold:
+            self._deferred_failures.extend(unique_failures(failures))
+        else:
+            self._enqueue_all(unique_failures(failures))
+        add_summary(self._reporting_language.SHARD_FAILURES_AGGREGATED.format(
+            count=len(failures),
+            shards=done_count,
+            shard_dir=self._shards.directory,
+        ))
+        self._shards.cleanup(claimed)
+
+    def _report_run_stats(self) -> None:
+        if self._run_stats_enabled:
+            print(f'Flakyzavr run stats, seconds:\n{self._stats.render_table()}')
+            print(f'Jira connections opened: {self._jira.connections_opened}')
+            if self._throttle:
+                stats = self._throttle.stats
+                print(
+                    f'Jira throttling: rate limit wait {stats.rate_limit_wait:.2f}s, '
+                    f'concurrency wait {stats.concurrency_wait:.2f}s '
+                    f'(limit {self._throttle.concurrency_limit}), '
+                    f'429 responses {stats.throttled_responses}, '
+                    f'retry after wait {stats.retry_after_wait:.2f}s'
+                )
+        if self._run_stats_json_path:
+            self._stats.write_json(self._run_stats_json_path)
+        if self._run_stats_prometheus_path:
+            self._stats.write_prometheus(self._run_stats_prometheus_path)
+
+    def _prefetch_issue_index(self) -> None:
+        statuses = ",".join([f'"{status}"' for status in self._jira_search_statuses])
+        search_prompt = (
+            f'project = {self._jira_project} '
+            f'and status in ({statuses}) '
+            f'and labels = {self._jira_flaky_label} '
+            'ORDER BY created'
+        )
+        found_issues = self._jira.search_issues(
+            jql_str=search_prompt,
+            max_results=False,
+            fields='labels,status' if self._jira_fingerprint_search else 'description,status',
+        )
+        if isinstance(found_issues, JiraUnavailable):
+            print(f'Jira {self._jira_server} unavailable, flaky issues index is not prefetched')
+            return
+
+        for issue in found_issues:
+            if self._jira_fingerprint_search:
+                lookup_keys = [label for label in (issue.fields.labels or [])
+                               if label.startswith(self._jira_fingerprint_label_prefix)]
+            else:
+                lookup_keys = _description_test_files(issue.fields.description or '')
+            for lookup_key in lookup_keys:
+                self._issue_index.setdefault(lookup_key, issue)
+
+        if self._issue_cache and not self._dry_run:
+            self._issue_cache.update({
+                lookup_key: (issue.key, _issue_status(issue))
+                for lookup_key, issue in self._issue_index.items()
+            })
+
+    @property
+    def search_batch_size(self) -> int:
+        return self._jira_search_batch_size
+
+    def lookup_key(self, failure: Failure) -> str:
+        # failures of one lookup key resolve to the same issue
+        if not self._jira_fingerprint_search:
+            return failure.test_file
+        return self._jira_fingerprint_label_prefix + failure.fingerprint
+
+    def _lookup_lock(self, lookup_key: str) -> threading.Lock:
+        with self._lookup_locks_lock:
+            return self._lookup_locks.setdefault(lookup_key, threading.Lock())
+
+    def _find_known_issue(self, lookup_key: str) -> Issue | None:
+        issue = self._run_issues.get(lookup_key)
+        if issue is None:
+            issue = self._issue_index.get(lookup_key)
+        if issue is not None:
+            return issue
+
+        if not self._issue_cache:
+            return None
+        cached = self._issue_cache.get(lookup_key)
+        if cached is None:
+            return None
+
+        cached_issue: Issue | JiraUnavailable = self._jira.issue(cached.issue_key, fields='status')
+        if isinstance(cached_issue, JiraIssueNotFound):
+            self._issue_cache.invalidate(lookup_key)
+            return None
+        if isinstance(cached_issue, JiraUnavailable):
+            return None
+        if _issue_status(cached_issue) not in self._jira_search_statuses:
+            self._issue_cache.invalidate(lookup_key)
+            return None
+        return cached_issue
 
     def _make_new_issue_summary_for_test(self, test_name: str, priority: str) -> str:
         return self._reporting_language.NEW_ISSUE_SUMMARY.format(
@@ -57,125 +387,595 @@ class FlakyzavrPlugin(Plugin):
         )
 
     def _get_scenario_priority(self, scenario: VirtualScenario) -> str:
-        template = getattr(scenario._orig_scenario, "__vedro__template__", None)
-
-        labels = getattr(template, "__vedro__allure_labels__", ())
-        labels += getattr(scenario._orig_scenario, "__vedro__allure_labels__", ())
+        return self._scenario_metadata.get(scenario).priority
 
-        for label in labels:
-            if label.name == 'priority':
-                return label.value
+    def _make_issue_fields(self, summary: str, description: str, extra_labels: list[str],
+                           flaky: bool = True) -> dict[str, Any]:
+        jira_labels = self._jira_labels
+        if not flaky:
+            jira_labels = [label for label in jira_labels if label != self._jira_flaky_label]
+        elif self._jira_flaky_label not in self._jira_labels:
+            jira_labels = jira_labels + [self._jira_flaky_label]
+        fields = {
+            'project': {'key': self._jira_project},
+            'summary': summary,
+            'description': description,
+            'issuetype': {'id': self._jira_issue_type_id},
+            'components': [{'name': component} for component in self._jira_components],
+            'labels': jira_labels + extra_labels,
+        }
+        if self._jira_additional_data:
+            fields.update(self._jira_additional_data)
+        return fields
 
-        return 'NOT_SET_PRIORITY'
+    def _render_tb(self, traceback: TracebackType, test_file: str) -> str:
+        return render_tb(traceback, test_file=test_file, max_frames=self._traceback_max_frames,
+                         skip_paths=self._traceback_skip_paths)
 
-    def _make_new_issue_description_for_test(self, scenario_result: ScenarioResult) -> str:
-        test_name = scenario_result.scenario.subject
+    def _make_failure(self, scenario_result: ScenarioResult,
+                      add_extra_details: Callable[[str], None]) -> Failure:
+        step_result = scenario_result._step_results[-1]
+        exc_info = step_result.exc_info
         test_file = str(scenario_result.scenario.rel_path)
-        priority = self._get_scenario_priority(scenario_result.scenario)
-        fail_error = scenario_result._step_results[-1].exc_info.value
-        fail_traceback = scenario_result._step_results[-1].exc_info.traceback
-        description = self._reporting_language.NEW_ISSUE_TEXT.format(
-            test_name=test_name,
+        with self._stats.timed('render_tb'):
+            traceback = self._render_tb(exc_info.traceback, test_file=test_file)
+        return Failure(
+            test_name=scenario_result.scenario.subject,
             test_file=test_file,
-            priority=priority,
-            traceback=render_tb(fail_traceback, test_file=test_file),
-            error=render_error(fail_error),
-            job_link=self._job_full_path
+            priority=self._get_scenario_priority(scenario_result.scenario),
+            error=render_error(exc_info.value),
+            error_type=type(exc_info.value).__name__,
+            error_signature=error_signature(exc_info.value),
+            error_message=str(exc_info.value),
+            traceback=traceback,
+            fingerprint=failure_fingerprint(exc_info.value, test_file, step_result.step.name),
+            job_link=self._job_full_path,
+            add_extra_details=add_extra_details,
+        )
+
+    def _fit_payload(self, traceback: str, error: str, test_file: str) -> tuple[str, str]:
+        if self._traceback_max_bytes is not None:
+            traceback = truncate_traceback(traceback, self._traceback_max_bytes, test_file)
+        if self._error_max_bytes is not None:
+            error = truncate_text(error, self._error_max_bytes)
+        return traceback, error
+
+    def _attach_full_failure(self, issue: Issue, failure: Failure) -> None:
+        if not self._attach_truncated:
+            return
+        fitted = self._fit_payload(failure.traceback, failure.error, failure.test_file)
+        if fitted == (failure.traceback, failure.error):
+            return
+        # background workers report failures of one issue concurrently
+        with self._attached_lock:
+            if (issue.key, failure.fingerprint) in self._attached:
+                return
+            self._attached.add((issue.key, failure.fingerprint))
+        content = gzip.compress(f'{failure.error}\n\n{failure.traceback}\n'.encode('utf-8'))
+        self._jira.add_attachment(issue, f'flakyzavr-{failure.fingerprint}.txt.gz', content)
+
+    def _make_new_issue_description_for_test(self, failure: Failure) -> str:
+        traceback, error = self._fit_payload(failure.traceback, failure.error, failure.test_file)
+        description = self._reporting_language.NEW_ISSUE_TEXT.format(
+            test_name=failure.test_name,
+            test_file=failure.test_file,
+            priority=failure.priority,
+            traceback=traceback,
+            error=error,
+            job_link=failure.job_link
         )
-        return description
+        return description + self._make_attempts_text(failure)
 
-    def _make_jira_comment(self, scenario_result: ScenarioResult) -> str:
-        test_name = scenario_result.scenario.subject
-        priority = self._get_scenario_priority(scenario_result.scenario)
-        fail_error = scenario_result._step_results[-1].exc_info.value
-        fail_traceback = scenario_result._step_results[-1].exc_info.traceback
+    def _make_jira_comment(self, failure: Failure) -> str:
+        traceback, error = self._fit_payload(failure.traceback, failure.error, failure.test_file)
         return self._reporting_language.NEW_COMMENT_TEXT.format(
-            test_name=test_name,
-            priority=priority,
-            job_link=self._job_full_path,
-            traceback=render_tb(fail_traceback, test_file=str(scenario_result.scenario.rel_path)),
-            error=render_error(fail_error),
+            test_name=failure.test_name,
+            priority=failure.priority,
+            job_link=failure.job_link,
+            traceback=traceback,
+            error=error,
+        ) + self._make_attempts_text(failure)
+
+    def _make_attempts_text(self, failure: Failure) -> str:
+        if failure.attempts <= 1:
+            return ''
+        return '\n' + self._reporting_language.FAILED_ATTEMPTS.format(
+            failed=failure.failed_attempts,
+            attempts=failure.attempts,
         )
 
-    def on_scenario_failed(self, event: Union[ScenarioPassedEvent, ScenarioFailedEvent]) -> None:
-        self._jira = LazyJiraTrier(
-            self._jira_server,
-            token=self._jira_token,
-            dry_run=self._dry_run
+    def _make_aggregated_jira_comment(self, comment: AggregatedComment) -> str:
+        failures = ''
+        for failure in comment.failures.values():
+            traceback, error = self._fit_payload(failure.traceback, failure.error,
+                                                 failure.test_file)
+            failures += self._reporting_language.AGGREGATED_COMMENT_FAILURE_TEXT.format(
+                count=failure.count,
+                test_names='\n'.join(failure.test_names),
+                priority=failure.priority,
+                traceback=traceback,
+                error=error,
+            )
+        return self._reporting_language.AGGREGATED_COMMENT_TEXT.format(
+            count=comment.count,
+            job_link=comment.records[0].job_link,
+            failures=failures,
         )
 
-        fail_error = str(event.scenario_result._step_results[-1].exc_info.value)
-        for exception_error in self._exceptions:
-            if re.search(exception_error, fail_error):
-                event.scenario_result.add_extra_details(self._reporting_language.FILTERED_OUT_BY_EXCEPTION_REGEXP)
+    def _add_aggregated_comment(self, comment: AggregatedComment,
+                                add_summary: Callable[[str], None]) -> None:
+        result = self._jira.add_comment(comment.issue, self._make_aggregated_jira_comment(comment))
+        if isinstance(result, JiraIssueNotFound) and self._issue_cache:
+            for lookup_key in comment.lookup_keys:
+                self._issue_cache.invalidate(lookup_key)
+        if isinstance(result, JiraUnavailable):
+            add_summary(
+                self._reporting_language
+                .SKIP_CREATING_COMMENT_IN_EXISTING_ISSUE_DUE_TO_JIRA_UNAVAILABILITY
+                .format(jira_server=self._jira_server) + f' ({comment.issue.key})'
+            )
+            self._spool_failures(comment.records)
+            return
+        first_records = {record.fingerprint: record for record in reversed(comment.records)}
+        for failure in first_records.values():
+            self._attach_full_failure(comment.issue, failure)
+
+    def _spool_failures(self, failures: list[Failure]) -> None:
+        if self._spool and failures:
+            self._spool.append(failures)
+
+    def on_scenario_failed(self, event: Union[ScenarioPassedEvent, ScenarioFailedEvent]) -> None:
+        self._handle_failed_result(event.scenario_result, event.scenario_result.add_extra_details,
+                                   [False])
+
+    def _handle_failed_result(self, scenario_result: ScenarioResult,
+                              add_extra_details: Callable[[str], None],
+                              outcomes: list[bool]) -> None:
+        with self._stats.timed('filter'):
+            filtered_out = self._is_filtered_out(scenario_result, add_extra_details)
+        if filtered_out:
+            return
+        scenario_id = scenario_result.scenario.unique_id
+        self._record_outcomes(scenario_id, outcomes)
+        if self._is_below_fail_rate(scenario_id, add_extra_details):
+            return
+
+        failure = self._make_failure(scenario_result, add_extra_details)
+        failure.attempts = len(outcomes)
+        failure.failed_attempts = outcomes.count(False)
+        if failure.attempts > 1:
+            add_extra_details(self._reporting_language.FAILED_ATTEMPTS.format(
+                failed=failure.failed_attempts,
+                attempts=failure.attempts,
+            ))
+        if self._shards:
+            self._shards.spool.append([failure])
+            failure.add_extra_details(
+                self._reporting_language.FAILURE_SPOOLED.format(spool_path=self._shards.spool.path)
+            )
+            return
+
+        if self._spool_only and self._spool:
+            self._spool.append([failure])
+            failure.add_extra_details(
+                self._reporting_language.FAILURE_SPOOLED.format(spool_path=self._spool.path)
+            )
+            return
+
+        if self._mass_failure_threshold:
+            self._deferred_failures.append(failure)
+            return
+
+        self._enqueue(failure)
+
+    def _enqueue(self, failure: Failure) -> None:
+        if self._jira_search_batch_size > 1:
+            self._search_batch.append(failure)
+            if len(self._search_batch) < self._jira_search_batch_size:
                 return
+            failures, self._search_batch = self._search_batch, []
+        else:
+            failures = [failure]
+
+        self._dispatch(failures)
+
+    def _enqueue_all(self, failures: list[Failure]) -> None:
+        if self._jira_bulk_create_size > 1 and failures:
+            # reported together, so their new issues are created with bulk requests
+            self._dispatch(failures)
+            return
+        for failure in failures:
+            self._enqueue(failure)
 
-        test_name = event.scenario_result.scenario.subject
-        test_file = str(event.scenario_result.scenario.rel_path)
+    def _report_deferred_failures(self, add_summary: Callable[[str], None]) -> None:
+        failures, self._deferred_failures = self._deferred_failures, []
+        self._enqueue_all(self.report_mass_failures(failures, add_summary))
 
+    def report_mass_failures(self, failures: list[Failure],
+                             add_summary: Callable[[str], None]) -> list[Failure]:
+        # reports clusters of mass_failure_threshold or more failures,
+        # returns failures left to report one by one
+        remaining = []
+        for cluster in cluster_failures(failures).values():
+            if self._mass_failure_threshold and len(cluster) >= self._mass_failure_threshold:
+                self._report_mass_failure(cluster, add_summary)
+                continue
+            remaining.extend(cluster)
+        return remaining
+
+    def _report_mass_failure(self, failures: list[Failure],
+                             add_summary: Callable[[str], None]) -> None:
+        # same outage fails next runs with same error,
+        # so its issue is found by label of error signature and commented
+        signature_label = self._make_mass_failure_signature_label(failures[0])
+        found_issues = self._jira.search_issues(
+            jql_str=self._make_mass_failure_search_prompt(signature_label)
+        )
+        if isinstance(found_issues, JiraUnavailable):
+            add_summary(
+                self._reporting_language.SKIP_CREATING_ISSUE_DUE_TO_JIRA_SEARCH_UNAVAILABILITY
+                .format(jira_server=self._jira_server) + f' ({len(failures)})'
+            )
+            self._spool_failures(failures)
+            return
+
+        if found_issues:
+            self._comment_mass_failure(found_issues[0], failures, add_summary)
+            return
+        self._create_mass_failure_issue(failures, signature_label, add_summary)
+
+    def _make_mass_failure_signature_label(self, failure: Failure) -> str:
+        return f'{self._jira_mass_failure_label}-{signature_hash(failure.error_signature)}'
+
+    def _make_mass_failure_search_prompt(self, signature_label: str) -> str:
         statuses = ",".join([f'"{status}"' for status in self._jira_search_statuses])
-        search_prompt = (
+        return (
+            f'project = {self._jira_project} '
+            f'and status in ({statuses}) '
+            f'and labels = {self._jira_mass_failure_label} '
+            f'and labels = {signature_label} '
+            'ORDER BY created'
+        )
+
+    def _comment_mass_failure(self, issue: Issue, failures: list[Failure],
+                              add_summary: Callable[[str], None]) -> None:
+        test_files = list(dict.fromkeys(failure.test_file for failure in failures))
+        comment = self._reporting_language.MASS_FAILURE_COMMENT_TEXT.format(
+            count=len(failures),
+            test_files='\n'.join(test_files),
+            job_link=failures[0].job_link,
+        )
+        result = self._jira.add_comment(issue, comment)
+        if isinstance(result, JiraUnavailable):
+            add_summary(
+                self._reporting_language
+                .SKIP_CREATING_COMMENT_IN_EXISTING_ISSUE_DUE_TO_JIRA_UNAVAILABILITY
+                .format(jira_server=self._jira_server) + f' ({issue.key})'
+            )
+            self._spool_failures(failures)
+            return
+
+        self._attach_full_failure(issue, failures[0])
+        details = self._reporting_language.MASS_FAILURE_ISSUE_EXISTS.format(
+            count=len(failures),
+            jira_server=self._jira_server,
+            issue_key=issue.key,
+        )
+        for failure in failures:
+            failure.add_extra_details(details)
+        add_summary(details)
+
+    def _create_mass_failure_issue(self, failures: list[Failure], signature_label: str,
+                                   add_summary: Callable[[str], None]) -> None:
+        first_failure = failures[0]
+        test_files = list(dict.fromkeys(failure.test_file for failure in failures))
+        summary = self._reporting_language.MASS_FAILURE_ISSUE_SUMMARY.format(
+            project_name=self._report_project_name,
+            count=len(failures),
+            error_type=first_failure.error_type,
+        )
+        traceback, error = self._fit_payload(first_failure.traceback, first_failure.error,
+                                             first_failure.test_file)
+        description = self._reporting_language.MASS_FAILURE_ISSUE_TEXT.format(
+            count=len(failures),
+            test_files='\n'.join(test_files),
+            traceback=traceback,
+            error=error,
+            job_link=first_failure.job_link,
+        )
+        result_issue = self._jira.create_issue(fields=self._make_issue_fields(
+            # without flaky label, so searches and prefetch by test file
+            # never resolve failures to outage issue
+            summary, description, flaky=False,
+            extra_labels=[self._jira_mass_failure_label, signature_label],
+        ))
+        if isinstance(result_issue, JiraUnavailable):
+            add_summary(
+                self._reporting_language.SKIP_CREATING_ISSUE_DUE_TO_JIRA_CREATE_UNAVAILABILITY
+                .format(jira_server=self._jira_server) + f' ({len(failures)})'
+            )
+            self._spool_failures(failures)
+            return
+
+        self._attach_full_failure(result_issue, first_failure)
+        details = self._reporting_language.MASS_FAILURE_ISSUE_CREATED.format(
+            count=len(failures),
+            jira_server=self._jira_server,
+            issue_key=result_issue.key,
+        )
+        for failure in failures:
+            failure.add_extra_details(details)
+        add_summary(details)
+
+    def _flush_search_batch(self) -> None:
+        failures, self._search_batch = self._search_batch, []
+        if failures:
+            self._dispatch(failures)
+
+    def _dispatch(self, failures: list[Failure]) -> None:
+        if self._report_queue:
+            self._report_queue.submit(failures)
+            return
+        self.report_failures(failures)
+
+    def _is_below_fail_rate(self, scenario_id: str,
+                            add_extra_details: Callable[[str], None]) -> bool:
+        if not self._flaky_history:
+            return False
+        failures, runs = self._flaky_history.fail_rate(scenario_id)
+        if runs >= self._flaky_history_min_runs and failures / runs >= self._flaky_min_fail_rate:
+            return False
+        add_extra_details(
+            self._reporting_language.FAIL_RATE_BELOW_THRESHOLD.format(failures=failures, runs=runs)
+        )
+        return True
+
+    def _is_filtered_out(self, scenario_result: ScenarioResult,
+                         add_extra_details: Callable[[str], None]) -> bool:
+        fail_error = str(scenario_result._step_results[-1].exc_info.value)
+        return self.is_filtered_out(fail_error, add_extra_details)
+
+    def is_filtered_out(self, fail_error: str,
+                        add_extra_details: Callable[[str], None] = print) -> bool:
+        pattern = self._exception_filter.match(fail_error)
+        if pattern is None:
+            return False
+        add_extra_details(
+            self._reporting_language.FILTERED_OUT_BY_EXCEPTION_REGEXP.format(pattern=pattern)
+        )
+        return True
+
+    def _make_search_prompt(self, test_files: list[str]) -> str:
+        statuses = ",".join([f'"{status}"' for status in self._jira_search_statuses])
+        descriptions = ' or '.join([
+            f'description ~ "\\"{test_file}\\""' for test_file in test_files
+        ])
+        if len(test_files) > 1:
+            descriptions = f'({descriptions})'
+        return (
             f'project = {self._jira_project} '
-            f'and description ~ "\\"{test_file}\\"" '
+            f'and {descriptions} '
             f'and status in ({statuses}) '
             f'and labels = {self._jira_flaky_label} '
             'ORDER BY created'
         )
 
-        found_issues = self._jira.search_issues(jql_str=search_prompt)
+    def _make_fingerprint_search_prompt(self, fingerprint_labels: list[str]) -> str:
+        statuses = ",".join([f'"{status}"' for status in self._jira_search_statuses])
+        labels = ",".join([f'"{label}"' for label in fingerprint_labels])
+        return (
+            f'project = {self._jira_project} '
+            f'and labels in ({labels}) '
+            f'and status in ({statuses}) '
+            f'and labels = {self._jira_flaky_label} '
+            'ORDER BY created'
+        )
+
+    def _search_issues_by_fingerprints(
+        self, fingerprint_labels: list[str]
+    ) -> dict[str, list[Issue]] | JiraUnavailable:
+        found_issues = self._jira.search_issues(
+            jql_str=self._make_fingerprint_search_prompt(fingerprint_labels),
+            max_results=False if len(fingerprint_labels) > 1 else 50,
+        )
         if isinstance(found_issues, JiraUnavailable):
-            event.scenario_result.add_extra_details(
-                self._reporting_language.SKIP_CREATING_ISSUE_DUE_TO_JIRA_SEARCH_UNAVAILABILITY.format(
-                    jira_server=self._jira_server
-                )
+            return found_issues
+
+        issues_by_labels: dict[str, list[Issue]] = {label: [] for label in fingerprint_labels}
+        for issue in found_issues:
+            for label in issue.fields.labels or []:
+                if label in issues_by_labels:
+                    issues_by_labels[label].append(issue)
+        return issues_by_labels
+
+    def _search_issues_by_files(self,
+                                test_files: list[str]) -> dict[str, list[Issue]] | JiraUnavailable:
+        if len(test_files) == 1:
+            found_issues = self._jira.search_issues(jql_str=self._make_search_prompt(test_files))
+            if isinstance(found_issues, JiraUnavailable):
+                return found_issues
+            return {test_files[0]: found_issues}
+
+        found_issues = self._jira.search_issues(
+            jql_str=self._make_search_prompt(test_files),
+            max_results=False,
+        )
+        if isinstance(found_issues, JiraUnavailable):
+            return found_issues
+
+        # jira matches description as a phrase, so results are mapped back to exact files locally
+        issues_by_files: dict[str, list[Issue]] = {test_file: [] for test_file in test_files}
+        for issue in found_issues:
+            description = issue.fields.description or ''
+            for test_file in test_files:
+                if test_file in description:
+                    issues_by_files[test_file].append(issue)
+        return issues_by_files
+
+    def report_failures(self, failures: list[Failure]) -> None:
+        # failures of the same file reported from different workers wait for each other
+        # so the second one reuses issue created by the first one
+        keyed_failures = [(self.lookup_key(failure), failure) for failure in failures]
+        with ExitStack() as stack:
+            for lookup_key in sorted({lookup_key for lookup_key, _ in keyed_failures}):
+                stack.enter_context(self._lookup_lock(lookup_key))
+            self._report_failures_locked(keyed_failures)
+
+    def _report_failures_locked(self, keyed_failures: list[tuple[str, Failure]]) -> None:
+        unknown_failures = []
+        new_issue_failures: list[tuple[str, Failure]] = []
+        for lookup_key, failure in keyed_failures:
+            issue = self._find_known_issue(lookup_key)
+            if issue is None:
+                unknown_failures.append((lookup_key, failure))
+            else:
+                self._report_to_found_issues(failure, lookup_key, [issue])
+
+        lookup_keys = list(dict.fromkeys(lookup_key for lookup_key, _ in unknown_failures))
+        for offset in range(0, len(lookup_keys), self._jira_search_batch_size):
+            chunk = lookup_keys[offset:offset + self._jira_search_batch_size]
+            chunk_failures = [(lookup_key, failure) for lookup_key, failure in unknown_failures
+                              if lookup_key in chunk]
+
+            if self._jira_fingerprint_search:
+                found_issues = self._search_issues_by_fingerprints(chunk)
+            else:
+                found_issues = self._search_issues_by_files(chunk)
+            if isinstance(found_issues, JiraUnavailable):
+                for _, failure in chunk_failures:
+                    failure.add_extra_details(
+                        self._reporting_language
+                        .SKIP_CREATING_ISSUE_DUE_TO_JIRA_SEARCH_UNAVAILABILITY
+                        .format(jira_server=self._jira_server)
+                    )
+                self._spool_failures([failure for _, failure in chunk_failures])
+                continue
+
+            for lookup_key, failure in chunk_failures:
+                is_new = lookup_key not in self._run_issues and not found_issues[lookup_key]
+                if is_new and self._jira_bulk_create_size > 1:
+                    new_issue_failures.append((lookup_key, failure))
+                else:
+                    self._report_to_found_issues(failure, lookup_key, found_issues[lookup_key])
+
+        self._create_issues_in_bulk(new_issue_failures)
+
+    def _create_issues_in_bulk(self, keyed_failures: list[tuple[str, Failure]]) -> None:
+        # one issue per lookup key, other failures of the key comment it once it is created
+        first_failures: dict[str, Failure] = {}
+        other_failures = []
+        for lookup_key, failure in keyed_failures:
+            if lookup_key in first_failures:
+                other_failures.append((lookup_key, failure))
+            else:
+                first_failures[lookup_key] = failure
+
+        pending = list(first_failures.items())
+        errors: dict[str, JiraUnavailable] = {}
+        for offset in range(0, len(pending), self._jira_bulk_create_size):
+            chunk = pending[offset:offset + self._jira_bulk_create_size]
+            errors.update(self._create_issues(chunk))
+
+        for lookup_key, failure in other_failures:
+            if lookup_key in self._run_issues:
+                self._report_to_found_issues(failure, lookup_key, [])
+            else:
+                self._skip_issue_creation(failure, errors[lookup_key])
+
+    def _remember_issue(self, lookup_key: str, issue: Issue) -> None:
+        self._run_issues[lookup_key] = issue
+        if not self._issue_cache or self._dry_run:
+            return
+        cached = self._issue_cache.get(lookup_key)
+        if cached is None or cached.issue_key != issue.key:
+            self._issue_cache.set(lookup_key, issue.key, _issue_status(issue))
+
+    def _report_to_found_issues(self, failure: Failure, lookup_key: str,
+                                found_issues: list[Issue]) -> None:
+        if lookup_key in self._run_issues:
+            found_issues = [self._run_issues[lookup_key]]
+
+        if found_issues and self._comment_aggregator:
+            issue = found_issues[0]  # type: ignore
+            self._comment_aggregator.add(issue, lookup_key=lookup_key, failure=failure)
+            self._remember_issue(lookup_key, issue)
+            failure.add_extra_details(
+                self._reporting_language.ISSUE_ALREADY_EXISTS.format(jira_server=self._jira_server,
+                                                                     issue_key=issue.key)
             )
             return
 
         if found_issues:
             issue = found_issues[0]  # type: ignore
-            comment = self._make_jira_comment(event.scenario_result)
+            comment = self._make_jira_comment(failure)
             result = self._jira.add_comment(issue, comment)
+            if isinstance(result, JiraIssueNotFound) and self._issue_cache:
+                self._issue_cache.invalidate(lookup_key)
             if isinstance(result, JiraUnavailable):
-                event.scenario_result.add_extra_details(
+                failure.add_extra_details(
                     self._reporting_language.SKIP_CREATING_COMMENT_IN_EXISTING_ISSUE_DUE_TO_JIRA_UNAVAILABILITY.format(
                         jira_server=self._jira_server
                     )
                 )
+                self._spool_failures([failure])
                 return
 
-            event.scenario_result.add_extra_details(
-                self._reporting_language.ISSUE_ALREADY_EXISTS.format(jira_server=self._jira_server, issue_key=issue.key)
+            self._attach_full_failure(issue, failure)
+            self._remember_issue(lookup_key, issue)
+            failure.add_extra_details(
+                self._reporting_language.ISSUE_ALREADY_EXISTS.format(jira_server=self._jira_server,
+                                                                     issue_key=issue.key)
             )
             return
 
-        priority = self._get_scenario_priority(event.scenario_result.scenario)
-        issue_name = self._make_new_issue_summary_for_test(test_name, priority)
-        issue_description = self._make_new_issue_description_for_test(event.scenario_result)
-        jira_labels = self._jira_labels
-        if self._jira_flaky_label not in self._jira_labels:
-            jira_labels += [self._jira_flaky_label]
-        created_ticket_fields = {
-                'project': {'key': self._jira_project},
-                'summary': issue_name,
-                'description': issue_description,
-                'issuetype': {'id': self._jira_issue_type_id},
-                'components': [{'name': component} for component in self._jira_components],
-                'labels': jira_labels,
-            }
-        if self._jira_additional_data:
-            created_ticket_fields.update(self._jira_additional_data)
-        result_issue = self._jira.create_issue(fields=created_ticket_fields)
-        if isinstance(result_issue, JiraUnavailable):
-            event.scenario_result.add_extra_details(
-                self._reporting_language.SKIP_CREATING_ISSUE_DUE_TO_JIRA_CREATE_UNAVAILABILITY.format(
-                    jira_server=self._jira_server
-                )
+        self._create_issues([(lookup_key, failure)])
+
+    def _make_new_issue_fields(self, lookup_key: str, failure: Failure) -> dict[str, Any]:
+        return self._make_issue_fields(
+            self._make_new_issue_summary_for_test(failure.test_name, failure.priority),
+            self._make_new_issue_description_for_test(failure),
+            extra_labels=[lookup_key] if self._jira_fingerprint_search else [],
+        )
+
+    def _create_issues(self,
+                       keyed_failures: list[tuple[str, Failure]]) -> dict[str, JiraUnavailable]:
+        # returns errors of issues not created by lookup key
+        field_list = [self._make_new_issue_fields(lookup_key, failure)
+                      for lookup_key, failure in keyed_failures]
+        if len(field_list) == 1:
+            results = [self._jira.create_issue(fields=field_list[0])]
+        else:
+            # bulk create reports result of every issue at its position
+            results = self._jira.create_issues(field_list)
+
+        errors = {}
+        for (lookup_key, failure), result_issue in zip(keyed_failures, results):
+            if isinstance(result_issue, JiraUnavailable):
+                self._skip_issue_creation(failure, result_issue)
+                errors[lookup_key] = result_issue
+                continue
+            self._attach_full_failure(result_issue, failure)
+            self._remember_issue(lookup_key, result_issue)
+            failure.add_extra_details(
+                self._reporting_language.ISSUE_CREATED.format(jira_server=self._jira_server,
+                                                              issue_key=result_issue.key)
             )
-            return
+        return errors
 
-        event.scenario_result.add_extra_details(
-            self._reporting_language.ISSUE_CREATED.format(jira_server=self._jira_server, issue_key=result_issue.key)
+    def _skip_issue_creation(self, failure: Failure, error: JiraUnavailable) -> None:
+        if isinstance(error, JiraIssueRejected):
+            failure.add_extra_details(self._reporting_language.ISSUE_REJECTED.format(
+                jira_server=self._jira_server,
+                errors=', '.join(f'{field}: {message}' for field, message in error.errors.items()),
+            ))
+            # jira would reject the same fields on replay, so rejected failures are not spooled
+            return
+        failure.add_extra_details(
+            self._reporting_language.SKIP_CREATING_ISSUE_DUE_TO_JIRA_CREATE_UNAVAILABILITY.format(
+                jira_server=self._jira_server
+            )
         )
+        self._spool_failures([failure])
 
 
 class Flakyzavr(PluginConfig):
@@ -195,16 +995,114 @@ class Flakyzavr(PluginConfig):
     jira_search_statuses: list[str] = ['Взят в бэклог', 'Open', 'Reopened', 'In Progress',
                                        'Code Review', 'Resolved', 'Testing']
     jira_search_forbidden_symbols: list[str] = ['[', ']', '"']
+    # >1 collects failed files and looks them up with one OR-combined query per batch,
+    # remaining files are looked up on cleanup
+    jira_search_batch_size: int = 1
+    # >1 creates new issues of batched failures (search batches, shards, `flakyzavr report`)
+    # with bulk requests of up to this many issues, jira accepts 50 per request by default
+    jira_bulk_create_size: int = 1
+    # load all open flaky issues on startup and search jira only for files missing in them
+    jira_prefetch_issues: bool = False
+    # search issues by label with failure fingerprint
+    # (error type, masked message, failed scenario step)
+    # instead of test file in description, so different failures of one file get different issues
+    jira_fingerprint_search: bool = False
+    jira_fingerprint_label_prefix: str = 'flaky-fp-'
+    # json file keeping test file -> issue key mapping between runs, shared by parallel jobs
+    jira_issue_cache_path: str | None = None
+    jira_issue_cache_ttl: float = 24 * 60 * 60
     # additional data for created jira issue: {'field_id': 'value'}
     # Example: {'customfield_10000': 'test'}
     jira_additional_data: dict[str, str] = {}
     jira_issue_type_id: str = '3'
+    # max pooled http connections kept open to jira for the whole run
+    jira_pool_size: int = 10
+    # after this many failed requests in a row jira is skipped for cooldown seconds,
+    # then one probe request decides whether to resume; None disables it
+    jira_circuit_breaker_threshold: int | None = 3
+    jira_circuit_breaker_cooldown: float = 60.0
+    # max issues, comments and links created per second, up to jira_write_burst at once
+    jira_write_rate: float | None = None
+    jira_write_burst: int = 1
+    # max concurrent writes, halved on 429 responses and grown back while jira keeps up
+    jira_write_concurrency: int | None = None
+    # with rate or concurrency set 429 responses are retried
+    # after Retry-After (capped) this many times
+    jira_throttle_retries: int = 3
+    jira_retry_after_max: float = 60.0
+    # print timings of filtering, rendering and jira calls with http calls and payload bytes,
+    # jira connections opened and throttling waits on cleanup
+    run_stats: bool = False
+    run_stats_json_path: str | None = None
+    # node_exporter textfile collector file, e.g. /var/lib/node_exporter/flakyzavr.prom
+    run_stats_prometheus_path: str | None = None
+    # decide once per scenario on ScenarioReportedEvent after vedro reruns
+    # instead of on every failed attempt,
+    # scenarios with at least one failed attempt are reported with "failed N of M attempts"
+    report_after_reruns: bool = False
+    # sqlite file with passed/failed outcomes of last flaky_history_window runs of every scenario,
+    # failures are reported only when scenario failed at least flaky_min_fail_rate of at least
+    # flaky_history_min_runs recorded runs, current run included
+    flaky_history_path: str | None = None
+    flaky_history_window: int = 50
+    flaky_min_fail_rate: float = 0.0
+    flaky_history_min_runs: int = 1
+    # byte budgets of traceback and error in issue descriptions and comments,
+    # jira text fields hold 32 KB; traceback keeps scenario frames and the frame raising error,
+    # error keeps its head and tail
+    jira_traceback_max_bytes: int | None = None
+    jira_error_max_bytes: int | None = None
+    # attach full gzipped traceback and error once per issue when they were truncated
+    jira_attach_truncated: bool = False
+    # factory of tracker used instead of jira client to benchmark or load test reporting
+    # without jira, e.g. functools.partial(FakeTracker, latency=0.05)
+    tracker_backend: Callable[[], TrackerBackend] | None = None
     report_project_name: str = 'NOT_SET'
     job_path = '{job_id}'
     job_id: str = 'NOT_SET'
 
     dry_run: bool = True
 
+    # buffer comments for existing issues and add one comment per issue on cleanup
+    jira_aggregate_comments: bool = False
+
+    # failures are kept until cleanup and grouped by error type and masked message,
+    # groups of at least this size get one mass failure issue instead of issue per test
+    mass_failure_threshold: int | None = None
+    # mass failure issue also gets this label suffixed with hash of error signature,
+    # so later runs failing the same way comment it instead of creating new one
+    jira_mass_failure_label: str = 'flaky-mass-failure'
+
+    # report failures from background workers instead of blocking scenarios run
+    report_async: bool = False
+    report_queue_size: int = 1000
+    report_workers: int = 4
+    # seconds to wait for queued and started reports on cleanup,
+    # unsent ones are listed in summary and spooled
+    report_flush_timeout: float = 60.0
+
+    # json lines file for failures that were not reported because jira was unavailable,
+    # replay it with `python -m flakyzavr replay`
+    spool_path: str | None = None
+    # only write failures to spool, jira is not touched during run
+    spool_only: bool = False
+
+    # shared directory where every shard writes its failures instead of reporting them,
+    # they are reported once by the last of `shard_count` shards
+    # or by `python -m flakyzavr aggregate`
+    shard_dir: str | None = None
+    # unique name of shard, e.g. CI_NODE_INDEX, hostname and pid by default
+    shard_id: str | None = None
+    shard_count: int | None = None
+
+    # keep at most this many frames of long tracebacks: first and last frames of scenario file,
+    # then head and tail of traceback, skipped frames are marked; at least 1
+    traceback_max_frames: int | None = None
+    # drop frames from files with these path parts, e.g. ['site-packages/', '/vedro/']
+    traceback_skip_paths: list[str] = []
+
     exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+    # plain substrings, matched all at once, use it for large deny-lists instead of regexps
+    exceptions_substrings: list[str] = []
 
     reporting_language: ReportingLangSet = RU_REPORTING_LANG
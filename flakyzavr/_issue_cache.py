@@ -0,0 +1,89 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from time import time
+from typing import Iterator
+from typing import NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+__all__ = ("IssueCache", "CachedIssue",)
+
+
+class CachedIssue(NamedTuple):
+    issue_key: str
+    status: str
+    fetched_at: float
+
+
+class IssueCache:
+    def __init__(self, path: str | Path, ttl: float) -> None:
+        self._path = Path(path)
+        self._lock_path = self._path.with_name(self._path.name + '.lock')
+        self._ttl = ttl
+        self._entries: dict[str, CachedIssue] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path, 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, CachedIssue]:
+        try:
+            raw = json.loads(self._path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        return {test_file: CachedIssue(*entry) for test_file, entry in raw.items()}
+
+    def _write(self, entries: dict[str, CachedIssue]) -> None:
+        tmp_path = self._path.with_name(f'{self._path.name}.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps(entries, separators=(',', ':')))
+        os.replace(tmp_path, self._path)
+
+    def load(self) -> None:
+        with self._lock, self._file_lock(exclusive=False):
+            self._entries = self._read()
+
+    def get(self, test_file: str) -> CachedIssue | None:
+        entry = self._entries.get(test_file)
+        if entry is None or time() - entry.fetched_at > self._ttl:
+            return None
+        return entry
+
+    def update(self, issues: dict[str, tuple[str, str]]) -> None:
+        fetched_at = time()
+        self._merge({
+            test_file: CachedIssue(issue_key, status, fetched_at)
+            for test_file, (issue_key, status) in issues.items()
+        })
+
+    def set(self, test_file: str, issue_key: str, status: str) -> None:
+        self.update({test_file: (issue_key, status)})
+
+    def invalidate(self, test_file: str) -> None:
+        self._merge({test_file: None})
+
+    def _merge(self, changes: dict[str, CachedIssue | None]) -> None:
+        # re-read under exclusive lock to keep entries written by parallel jobs
+        with self._lock, self._file_lock(exclusive=True):
+            entries = self._read()
+            for test_file, entry in changes.items():
+                if entry is None:
+                    entries.pop(test_file, None)
+                else:
+                    entries[test_file] = entry
+            self._write(entries)
+            self._entries = entries
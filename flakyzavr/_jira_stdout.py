@@ -1,13 +1,27 @@
+import threading
 from collections import namedtuple
+from io import BytesIO
 from json import JSONDecodeError as jsonJSONDecodeError
 from typing import Any
+from typing import Callable
 
 from jira import Issue
 from jira import JIRA
 from jira import JIRAError
+from requests import ConnectionError as requestsConnectionError
 from requests import JSONDecodeError as requestsJSONDecodeError
+from requests import Response
+from requests import Timeout as requestsTimeout
+from requests.adapters import HTTPAdapter
 from rtry import retry
 
+from flakyzavr._circuit_breaker import CircuitBreaker
+from flakyzavr._run_stats import RunStats
+from flakyzavr._throttle import JiraThrottle
+
+JIRA_REQUEST_ERRORS = (JIRAError, jsonJSONDecodeError, requestsJSONDecodeError,
+                       requestsConnectionError, requestsTimeout)
+
 MockIssue = namedtuple('MockIssue', ['key'])
 
 
@@ -19,108 +33,227 @@ class JiraUnavailable:
     ...
 
 
+class JiraIssueNotFound(JiraUnavailable):
+    ...
+
+
+class JiraIssueRejected(JiraUnavailable):
+    # item of bulk create rejected by jira, e.g. field validation errors
+    def __init__(self, errors: dict[str, str]) -> None:
+        self.errors = errors
+
+
+def _retry_after(error: JIRAError) -> str | None:
+    headers = getattr(error.response, 'headers', None) or {}
+    return headers.get('Retry-After')
+
+
 class LazyJiraTrier:
-    def __init__(self, server, token, dry_run=False) -> None:
+    def __init__(self, server, token, dry_run=False, pool_size=10,
+                 circuit_breaker: CircuitBreaker | None = None,
+                 throttle: JiraThrottle | None = None,
+                 stats: RunStats | None = None) -> None:
         self._server = server
         self._token = token
         self._jira = None
         self._dry_run = dry_run
+        self._pool_size = pool_size
+        self._connections_opened = 0
+        self._connect_lock = threading.Lock()
+        self._circuit_breaker = circuit_breaker
+        self._throttle = throttle
+        self._stats = stats or RunStats()
+
+    @property
+    def connections_opened(self) -> int:
+        return self._connections_opened
+
+    def _mount_pool(self, jira: JIRA) -> None:
+        for prefix in ('http://', 'https://'):
+            jira._session.adapters[prefix].close()
+            jira._session.mount(prefix, HTTPAdapter(pool_maxsize=self._pool_size))
+
+    def _count_http_call(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        body = response.request.body or b''
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self._stats.count('http_calls')
+        # attachments are streamed with multipart encoder, it knows its length
+        request_bytes = len(body) if isinstance(body, bytes) else getattr(body, 'len', 0)
+        self._stats.count('request_bytes', request_bytes)
+        self._stats.count('response_bytes', len(response.content or b''))
 
     def connect(self) -> JIRA | JiraUnavailable:
+        with self._connect_lock:
+            return self._connect()
+
+    def _connect(self) -> JIRA | JiraUnavailable:
         if not self._jira:
             try:
-                self._jira = JIRA(server=self._server, token_auth=self._token)
+                # with throttle 429 responses are retried here,
+                # not slept through inside jira session
+                max_retries = 0 if self._throttle else 3
+                with self._stats.timed('connect'):
+                    self._jira = JIRA(server=self._server, token_auth=self._token,
+                                      max_retries=max_retries)
+                self._connections_opened += 1
+                self._mount_pool(self._jira)
+                self._jira._session.hooks['response'].append(self._count_http_call)
             except JIRAError as e:
                 if e.status_code == 403:
                     raise JiraAuthorizationError from None
                 self._jira = None
                 return JiraUnavailable()
-            except jsonJSONDecodeError as e:
-                self._jira = None
-                return JiraUnavailable()
-            except requestsJSONDecodeError as e:
+            except (jsonJSONDecodeError, requestsJSONDecodeError,
+                    requestsConnectionError, requestsTimeout):
                 self._jira = None
                 return JiraUnavailable()
 
         return self._jira
 
-    def search_issues(self, jql_str: str) -> list[Issue] | JiraUnavailable:
-        if self._dry_run:
-            print(f'Query: {jql_str}')
-        res = retry(delay=1, attempts=3, until=lambda x: isinstance(x, JiraUnavailable), logger=print)(self.connect)()
-        if isinstance(res, JiraUnavailable):
-            return res
+    def close(self) -> None:
+        if self._jira:
+            self._jira.close()
+        self._jira = None
 
-        try:
-            return retry(
-                delay=1,
-                attempts=3,
-                swallow=(JIRAError, jsonJSONDecodeError, requestsJSONDecodeError)
-            )(self._jira.search_issues)(jql_str=jql_str)
-        except JIRAError as e:
-            return JiraUnavailable()
-        except jsonJSONDecodeError as e:
-            return JiraUnavailable()
-        except requestsJSONDecodeError as e:
+    def _call(self, phase: str, operation: Callable[[JIRA], Any], attempts: int = 1,
+              write: bool = False) -> Any:
+        if self._circuit_breaker and not self._circuit_breaker.allow():
             return JiraUnavailable()
 
-    def add_comment(self, issue: Issue, comment: str) -> None | JiraUnavailable:
-        res = retry(delay=1, attempts=3, until=lambda x: isinstance(x, JiraUnavailable), logger=print)(self.connect)()
+        res = retry(
+            delay=1,
+            attempts=3,
+            until=lambda x: isinstance(x, JiraUnavailable),
+            logger=print,
+        )(self.connect)()
         if isinstance(res, JiraUnavailable):
+            self._record_failure()
             return res
 
-        if self._dry_run:
-            print(f'Comment to create: {comment} in {issue.key}')
-            return
+        throttle = self._throttle if write else None
+        if throttle:
+            throttle.acquire()
+        throttled = False
+        calls = 0
+
+        def counted_operation(jira: JIRA) -> Any:
+            nonlocal calls
+            calls += 1
+            return operation(jira)
 
         try:
-            self._jira.add_comment(issue, comment)
-        except JIRAError as e:
-            return JiraUnavailable()
-        except jsonJSONDecodeError as e:
-            return JiraUnavailable()
-        except requestsJSONDecodeError as e:
-            return JiraUnavailable()
-        return
+            throttle_attempt = 0
+            while True:
+                try:
+                    with self._stats.timed(phase):
+                        retried = retry(delay=1, attempts=attempts, swallow=JIRA_REQUEST_ERRORS)
+                        result = retried(counted_operation)(res)
+                except JIRAError as e:
+                    if e.status_code == 429:
+                        # jira is up but throttles us, so it closes circuit breaker, otherwise
+                        # throttled half-open probe would leave it skipping requests for good
+                        self._record_success()
+                        throttled = True
+                        if self._throttle and throttle_attempt < self._throttle.retries:
+                            with self._stats.timed('retry_after'):
+                                self._throttle.wait_retry_after(_retry_after(e), throttle_attempt)
+                            throttle_attempt += 1
+                            continue
+                        return JiraUnavailable()
+                    if e.status_code is not None and e.status_code < 500:
+                        # jira is up, request itself is wrong
+                        self._record_success()
+                        if e.status_code == 404:
+                            return JiraIssueNotFound()
+                        return JiraUnavailable()
+                    self._record_failure()
+                    return JiraUnavailable()
+                except JIRA_REQUEST_ERRORS:
+                    self._record_failure()
+                    return JiraUnavailable()
+                self._record_success()
+                return result
+        finally:
+            if calls > 1:
+                self._stats.count('retries', calls - 1)
+            if throttle:
+                throttle.release(throttled)
 
-    def create_issue(self, fields: dict[str, Any]) -> Issue | MockIssue | JiraUnavailable:
-        res = retry(delay=1, attempts=3, until=lambda x: isinstance(x, JiraUnavailable), logger=print)(self.connect)()
-        if isinstance(res, JiraUnavailable):
-            return res
+    def _record_success(self) -> None:
+        if self._circuit_breaker:
+            self._circuit_breaker.record_success()
+
+    def _record_failure(self) -> None:
+        if self._circuit_breaker and self._circuit_breaker.record_failure():
+            print(f'Jira {self._server} is unavailable, requests are skipped until cooldown ends')
 
+    def search_issues(self, jql_str: str, max_results: int | bool = 50,
+                      fields: str = '*all') -> list[Issue] | JiraUnavailable:
         if self._dry_run:
-            print(f'Issue to create: {fields}')
-            return MockIssue(key='EXISTING_MOCKED_ISSUE')
+            print(f'Query: {jql_str}')
+        return self._call(
+            'search',
+            lambda jira: jira.search_issues(jql_str=jql_str, maxResults=max_results,
+                                            fields=fields),
+            attempts=3,
+        )
 
-        try:
-            issue = self._jira.create_issue(fields=fields)
-        except JIRAError as e:
-            return JiraUnavailable()
-        except jsonJSONDecodeError as e:
-            return JiraUnavailable()
-        except requestsJSONDecodeError as e:
-            return JiraUnavailable()
-        return issue
+    def issue(self, key: str, fields: str = '*all') -> Issue | JiraUnavailable:
+        return self._call('issue', lambda jira: jira.issue(key, fields=fields))
 
-    def create_issue_link(self, inwardIssue: str, outwardIssue: str) -> None | JiraUnavailable:
-        res = retry(delay=1, attempts=3, until=lambda x: isinstance(x, JiraUnavailable), logger=print)(self.connect)()
-        if isinstance(res, JiraUnavailable):
-            return res
+    def add_comment(self, issue: Issue, comment: str) -> None | JiraUnavailable:
+        def add_comment(jira: JIRA) -> None:
+            if self._dry_run:
+                print(f'Comment to create: {comment} in {issue.key}')
+                return
+            jira.add_comment(issue, comment)
+        return self._call('comment', add_comment, write=True)
 
-        if self._dry_run:
-            print(f'Link {inwardIssue} with {outwardIssue}')
-            return
+    def create_issue(self, fields: dict[str, Any]) -> Issue | MockIssue | JiraUnavailable:
+        def create_issue(jira: JIRA) -> Issue | MockIssue:
+            if self._dry_run:
+                print(f'Issue to create: {fields}')
+                return MockIssue(key='EXISTING_MOCKED_ISSUE')
+            return jira.create_issue(fields=fields)
+        return self._call('create', create_issue, write=True)
 
-        try:
-            self._jira.create_issue_link(
+    def add_attachment(self, issue: Issue | MockIssue, filename: str,
+                       content: bytes) -> None | JiraUnavailable:
+        def add_attachment(jira: JIRA) -> None:
+            if self._dry_run:
+                print(f'Attachment to add: {filename} ({len(content)} bytes) to {issue.key}')
+                return
+            jira.add_attachment(issue=issue.key, attachment=BytesIO(content), filename=filename)
+        return self._call('attachment', add_attachment, write=True)
+
+    def create_issues(
+        self, field_list: list[dict[str, Any]]
+    ) -> list[Issue | MockIssue | JiraUnavailable]:
+        def create_issues(jira: JIRA) -> list[Issue | MockIssue | JiraUnavailable]:
+            if self._dry_run:
+                for fields in field_list:
+                    print(f'Issue to create: {fields}')
+                return [MockIssue(key='EXISTING_MOCKED_ISSUE') for _ in field_list]
+            created = jira.create_issues(field_list=field_list, prefetch=False)
+            return [
+                item['issue'] if item['status'] == 'Success'
+                else JiraIssueRejected(item['error'] or {})
+                for item in created
+            ]
+        result = self._call('create', create_issues, write=True)
+        if isinstance(result, JiraUnavailable):
+            return [result for _ in field_list]
+        return result
+
+    def create_issue_link(self, inwardIssue: str, outwardIssue: str) -> None | JiraUnavailable:
+        def create_issue_link(jira: JIRA) -> None:
+            if self._dry_run:
+                print(f'Link {inwardIssue} with {outwardIssue}')
+                return
+            jira.create_issue_link(
                 type='is linked with',
                 inwardIssue=inwardIssue,
                 outwardIssue=outwardIssue
             )
-        except JIRAError as e:
-            return JiraUnavailable()
-        except jsonJSONDecodeError as e:
-            return JiraUnavailable()
-        except requestsJSONDecodeError as e:
-            return JiraUnavailable()
-        return
+        return self._call('link', create_issue_link, write=True)
@@ -12,10 +12,71 @@ class ReportingLangSet(NamedTuple):
     NEW_ISSUE_SUMMARY: str
     NEW_ISSUE_TEXT: str
     NEW_COMMENT_TEXT: str
+    REPORT_PENDING: str = (
+        'Report for {test_file} was not sent to {jira_server} before flush timeout'
+    )
+    AGGREGATED_COMMENT_TEXT: str = (
+        'Repeated test fails during run: {count}\n'
+        '{job_link}\n'
+        '{failures}'
+    )
+    AGGREGATED_COMMENT_FAILURE_TEXT: str = (
+        'Fails with this error: {count}\n'
+        '{{code:python}}\n'
+        '{test_names}\n'
+        '{{code}}\n'
+        'Test priority - {priority}\n'
+        '{{code:python}}\n'
+        '{traceback}\n'
+        '--------------------------------------------------------------------------------\n'
+        '{error}\n'
+        '{{code}}\n'
+    )
+    MASS_FAILURE_ISSUE_SUMMARY: str = (
+        '[{project_name}] Mass failure: {count} tests failed with {error_type}'
+    )
+    MASS_FAILURE_ISSUE_TEXT: str = (
+        'h2. {{color:#172b4d}}Context{{color}}\n'
+        'Tests failed with the same error during run: {count}\n'
+        '{{code:python}}\n'
+        '{test_files}\n'
+        '{{code}}\n'
+        'First fail:\n'
+        '{{code:python}}\n'
+        '{traceback}\n'
+        '--------------------------------------------------------------------------------\n'
+        '{error}\n'
+        '{{code}}\n'
+        '{job_link}\n'
+    )
+    MASS_FAILURE_ISSUE_CREATED: str = (
+        'Issue for mass failure of {count} tests created: {jira_server}/browse/{issue_key}'
+    )
+    MASS_FAILURE_ISSUE_EXISTS: str = (
+        'Issue for mass failure of {count} tests already exists: {jira_server}/browse/{issue_key}'
+    )
+    MASS_FAILURE_COMMENT_TEXT: str = (
+        'Repeated mass failure: {count} tests failed with the same error\n'
+        '{{code:python}}\n'
+        '{test_files}\n'
+        '{{code}}\n'
+        '{job_link}\n'
+    )
+    FAILURE_SPOOLED: str = 'Failure is saved to {spool_path} to be reported later'
+    SHARD_FAILURES_AGGREGATED: str = (
+        'Reported {count} failures of {shards} shards from {shard_dir}'
+    )
+    FAIL_RATE_BELOW_THRESHOLD: str = (
+        'Skip reporting, scenario failed {failures} of last {runs} runs'
+    )
+    FAILED_ATTEMPTS: str = 'Failed {failed} of {attempts} attempts'
+    ISSUE_REJECTED: str = '{jira_server} rejected issue for current test: {errors}'
 
 
 RU_REPORTING_LANG = ReportingLangSet(
-    FILTERED_OUT_BY_EXCEPTION_REGEXP='Флаки тикета не будет создно. Падение отфильтровано по списку исключений.',
+    FILTERED_OUT_BY_EXCEPTION_REGEXP=(
+        'Флаки тикета не будет создно. Падение отфильтровано по списку исключений: {pattern}'
+    ),
     SKIP_CREATING_ISSUE_DUE_TO_JIRA_SEARCH_UNAVAILABILITY=(
         '{jira_server} не был доступен во время поиска тикетов. '
         'Пропускаем создание тикета для текущего теста'
@@ -68,11 +129,70 @@ RU_REPORTING_LANG = ReportingLangSet(
         '--------------------------------------------------------------------------------\n'
         '{error}\n'
         '{{code}}\n'
-    )
+    ),
+    REPORT_PENDING=(
+        'Отчет о падении {test_file} не был отправлен в {jira_server} до истечения таймаута'
+    ),
+    AGGREGATED_COMMENT_TEXT=(
+        'Повторный флак, падений за прогон: {count}\n'
+        '{job_link}\n'
+        '{failures}'
+    ),
+    AGGREGATED_COMMENT_FAILURE_TEXT=(
+        'Падений с этой ошибкой: {count}\n'
+        '{{code:python}}\n'
+        '{test_names}\n'
+        '{{code}}\n'
+        'Приоритет теста - {priority}\n'
+        '{{code:python}}\n'
+        '{traceback}\n'
+        '--------------------------------------------------------------------------------\n'
+        '{error}\n'
+        '{{code}}\n'
+    ),
+    MASS_FAILURE_ISSUE_SUMMARY=(
+        '[{project_name}] Массовое падение: {count} тестов упали с {error_type}'
+    ),
+    MASS_FAILURE_ISSUE_TEXT=(
+        'h2. {{color:#172b4d}}Контекст{{color}}\n'
+        'Тестов упало за прогон с одной и той же ошибкой: {count}\n'
+        '{{code:python}}\n'
+        '{test_files}\n'
+        '{{code}}\n'
+        'Первое падение:\n'
+        '{{code:python}}\n'
+        '{traceback}\n'
+        '--------------------------------------------------------------------------------\n'
+        '{error}\n'
+        '{{code}}\n'
+        '{job_link}\n'
+    ),
+    MASS_FAILURE_ISSUE_CREATED=(
+        'Заведен тикет на массовое падение {count} тестов {jira_server}/browse/{issue_key}'
+    ),
+    MASS_FAILURE_ISSUE_EXISTS=(
+        'Тикет на массовое падение {count} тестов уже есть {jira_server}/browse/{issue_key}'
+    ),
+    MASS_FAILURE_COMMENT_TEXT=(
+        'Повторное массовое падение: {count} тестов упали с одной и той же ошибкой\n'
+        '{{code:python}}\n'
+        '{test_files}\n'
+        '{{code}}\n'
+        '{job_link}\n'
+    ),
+    FAILURE_SPOOLED='Падение сохранено в {spool_path}, тикет будет заведен позже',
+    SHARD_FAILURES_AGGREGATED='Отправлено {count} падений из {shards} шардов из {shard_dir}',
+    FAIL_RATE_BELOW_THRESHOLD=(
+        'Пропускаем заведение тикета, сценарий упал {failures} из последних {runs} прогонов'
+    ),
+    FAILED_ATTEMPTS='Упал в {failed} из {attempts} попыток',
+    ISSUE_REJECTED='{jira_server} отклонил флаки тикет для текущего теста: {errors}',
 )
 
 EN_REPORTING_LANG = ReportingLangSet(
-    FILTERED_OUT_BY_EXCEPTION_REGEXP='Issue for flaky test won\'t be created. Fail reason skipped by exception list.',
+    FILTERED_OUT_BY_EXCEPTION_REGEXP=(
+        'Issue for flaky test won\'t be created. Fail reason skipped by exception list: {pattern}'
+    ),
     SKIP_CREATING_ISSUE_DUE_TO_JIRA_SEARCH_UNAVAILABILITY=(
         '{jira_server} was unavailable while searching for issues. '
         'Skip creating issue for current test.'
@@ -116,5 +236,58 @@ EN_REPORTING_LANG = ReportingLangSet(
         '--------------------------------------------------------------------------------\n'
         '{error}\n'
         '{{code}}\n'
-    )
+    ),
+    REPORT_PENDING='Report for {test_file} was not sent to {jira_server} before flush timeout',
+    AGGREGATED_COMMENT_TEXT=(
+        'Repeated test fails during run: {count}\n'
+        '{job_link}\n'
+        '{failures}'
+    ),
+    AGGREGATED_COMMENT_FAILURE_TEXT=(
+        'Fails with this error: {count}\n'
+        '{{code:python}}\n'
+        '{test_names}\n'
+        '{{code}}\n'
+        'Test priority - {priority}\n'
+        '{{code:python}}\n'
+        '{traceback}\n'
+        '--------------------------------------------------------------------------------\n'
+        '{error}\n'
+        '{{code}}\n'
+    ),
+    MASS_FAILURE_ISSUE_SUMMARY=(
+        '[{project_name}] Mass failure: {count} tests failed with {error_type}'
+    ),
+    MASS_FAILURE_ISSUE_TEXT=(
+        'h2. {{color:#172b4d}}Context{{color}}\n'
+        'Tests failed with the same error during run: {count}\n'
+        '{{code:python}}\n'
+        '{test_files}\n'
+        '{{code}}\n'
+        'First fail:\n'
+        '{{code:python}}\n'
+        '{traceback}\n'
+        '--------------------------------------------------------------------------------\n'
+        '{error}\n'
+        '{{code}}\n'
+        '{job_link}\n'
+    ),
+    MASS_FAILURE_ISSUE_CREATED=(
+        'Issue for mass failure of {count} tests created: {jira_server}/browse/{issue_key}'
+    ),
+    MASS_FAILURE_ISSUE_EXISTS=(
+        'Issue for mass failure of {count} tests already exists: {jira_server}/browse/{issue_key}'
+    ),
+    MASS_FAILURE_COMMENT_TEXT=(
+        'Repeated mass failure: {count} tests failed with the same error\n'
+        '{{code:python}}\n'
+        '{test_files}\n'
+        '{{code}}\n'
+        '{job_link}\n'
+    ),
+    FAILURE_SPOOLED='Failure is saved to {spool_path} to be reported later',
+    SHARD_FAILURES_AGGREGATED='Reported {count} failures of {shards} shards from {shard_dir}',
+    FAIL_RATE_BELOW_THRESHOLD='Skip reporting, scenario failed {failures} of last {runs} runs',
+    FAILED_ATTEMPTS='Failed {failed} of {attempts} attempts',
+    ISSUE_REJECTED='{jira_server} rejected issue for current test: {errors}',
 )
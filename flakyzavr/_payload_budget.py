@@ -0,0 +1,62 @@
+__all__ = ("truncate_text", "truncate_traceback",)
+
+
+def _size(text: str) -> int:
+    return len(text.encode('utf-8'))
+
+
+def truncate_text(text: str, max_bytes: int) -> str:
+    # head and tail are kept, long assertion diffs differ at both ends
+    data = text.encode('utf-8')
+    if len(data) <= max_bytes:
+        return text
+    # marker counts less bytes than whole text, so its size with len(data) is an upper bound
+    keep = max_bytes - _size(f'\n... {len(data)} bytes truncated ...\n')
+    if keep <= 0:
+        return data[:max_bytes].decode('utf-8', 'ignore')
+    head = data[:keep - keep // 2].decode('utf-8', 'ignore')
+    tail = data[len(data) - keep // 2:].decode('utf-8', 'ignore') if keep // 2 else ''
+    return f'{head}\n... {len(data) - _size(head) - _size(tail)} bytes truncated ...\n{tail}'
+
+
+def _render_frames(frames: list[str], kept: list[int]) -> str:
+    rendered = []
+    previous = -1
+    for idx in kept:
+        if idx - previous > 1:
+            rendered.append(f'# ... {idx - previous - 1} frames skipped ...')
+        rendered.append(frames[idx])
+        previous = idx
+    if len(frames) - previous > 1:
+        rendered.append(f'# ... {len(frames) - previous - 1} frames skipped ...')
+    return '\n\n'.join(rendered)
+
+
+def truncate_traceback(traceback: str, max_bytes: int, test_file: str) -> str:
+    if _size(traceback) <= max_bytes:
+        return traceback
+
+    # frames are rendered by render_tb as `# path:` header with code lines, separated by blank line
+    frames = traceback.split('\n\n')
+    required = {idx for idx, frame in enumerate(frames) if test_file in frame.split('\n', 1)[0]}
+    required.add(len(frames) - 1)
+
+    if _size(_render_frames(frames, sorted(required))) > max_bytes:
+        # separators and skipped frames markers don't depend on frames content
+        overhead = _size(_render_frames([''] * len(frames), sorted(required)))
+        frame_budget = max(max_bytes - overhead, 0) // len(required)
+        frames = [truncate_text(frame, frame_budget) if idx in required else frame
+                  for idx, frame in enumerate(frames)]
+        rendered = _render_frames(frames, sorted(required))
+        # budget too small even for markers of skipped frames
+        return rendered if _size(rendered) <= max_bytes else truncate_text(rendered, max_bytes)
+
+    # frames closer to the error are more useful, they are added back first while budget allows
+    kept = set(required)
+    for idx in reversed(range(len(frames))):
+        if idx in kept:
+            continue
+        if _size(_render_frames(frames, sorted(kept | {idx}))) > max_bytes:
+            break
+        kept.add(idx)
+    return _render_frames(frames, sorted(kept))
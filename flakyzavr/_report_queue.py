@@ -0,0 +1,101 @@
+import threading
+from queue import Empty
+from queue import Full
+from queue import Queue
+from time import monotonic
+from typing import Callable
+
+from flakyzavr._failure import Failure
+
+__all__ = ("ReportQueue",)
+
+
+class ReportQueue:
+    def __init__(self, handler: Callable[[list[Failure]], None], maxsize: int,
+                 workers: int) -> None:
+        self._handler = handler
+        self._queue: Queue[list[Failure] | None] = Queue(maxsize=maxsize)
+        self._workers = [
+            threading.Thread(target=self._work, name=f'flakyzavr-reporter-{idx}', daemon=True)
+            for idx in range(workers)
+        ]
+        self._pending: dict[int, Failure] = {}
+        self._in_progress: set[int] = set()
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, failures: list[Failure]) -> None:
+        self.start()
+        with self._lock:
+            for failure in failures:
+                self._pending[id(failure)] = failure
+        # blocks when queue is full, so slow jira backpressures the run instead of growing memory
+        self._queue.put(failures)
+
+    def _work(self) -> None:
+        while True:
+            failures = self._queue.get()
+            if failures is None:
+                return
+            with self._lock:
+                if self._cancelled:
+                    # flush timed out, these failures were returned by it as not reported
+                    continue
+                self._in_progress.update(id(failure) for failure in failures)
+            try:
+                self._handler(failures)
+            except Exception as e:
+                test_files = ', '.join(failure.test_file for failure in failures)
+                print(f'Failed to report {test_files}: {e!r}')
+            finally:
+                with self._lock:
+                    for failure in failures:
+                        self._pending.pop(id(failure), None)
+                        self._in_progress.discard(id(failure))
+
+    def flush(self, timeout: float) -> list[Failure]:
+        # returns failures no worker started before timeout,
+        # they are never reported by workers after it
+        if not self._started:
+            return []
+        deadline = monotonic() + timeout
+        for _ in self._workers:
+            try:
+                self._queue.put(None, timeout=max(deadline - monotonic(), 0))
+            except Full:
+                break
+        for worker in self._workers:
+            worker.join(max(deadline - monotonic(), 0))
+        with self._lock:
+            self._cancelled = True
+            not_started = [failure for key, failure in self._pending.items()
+                           if key not in self._in_progress]
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+        return not_started
+
+    def stop(self, timeout: float) -> list[Failure]:
+        # waits for failures workers started before flush timeout at most timeout,
+        # returns ones still in progress after it
+        deadline = monotonic() + timeout
+        for _ in self._workers:
+            # queue is drained by flush, so every alive worker takes one of these
+            try:
+                self._queue.put(None, timeout=max(deadline - monotonic(), 0))
+            except Full:
+                break
+        for worker in self._workers:
+            worker.join(max(deadline - monotonic(), 0))
+        with self._lock:
+            return [self._pending[key] for key in self._in_progress if key in self._pending]
@@ -0,0 +1,142 @@
+import json
+import re
+from pathlib import Path
+from typing import Any
+from typing import Iterator
+
+from flakyzavr._failure import Failure
+from flakyzavr._fingerprint import signature_fingerprint
+from flakyzavr._fingerprint import source_line
+from flakyzavr._fingerprint import text_error_signature
+from flakyzavr._spool import read_failures
+
+__all__ = ("read_results", "read_vedro_json", "read_allure_results",)
+
+FAILED_STATUSES = ('failed', 'broken')
+TRACE_FRAME = re.compile(r'^\s*File "(?P<file>[^"]+)", line (?P<lineno>\d+), in (?P<name>\S+)')
+ERROR_TYPE = re.compile(r'^(?P<type>[A-Za-z_][\w.]*)(?::|$)')
+
+
+def _test_file(unique_id: str, path: str) -> str:
+    # unique_id is `scenarios/path/to/file.py::Scenario`, path is absolute
+    if '::' in unique_id:
+        return unique_id.split('::', 1)[0]
+    return path
+
+
+def _make_failure(test_name: str, test_file: str, priority: str, error_type: str, message: str,
+                  traceback: str, step_name: str, job_link: str) -> Failure:
+    signature = text_error_signature(error_type, message)
+    return Failure(
+        test_name=test_name,
+        test_file=test_file,
+        priority=priority,
+        error=f'{error_type}{message}',
+        error_type=error_type,
+        error_signature=signature,
+        error_message=message,
+        traceback=traceback,
+        fingerprint=signature_fingerprint(signature, test_file, step_name),
+        job_link=job_link,
+    )
+
+
+def _json_lines(path: Path) -> Iterator[dict[str, Any]]:
+    with open(path, encoding='utf-8') as report_file:
+        for line in report_file:
+            line = line.strip()
+            if line.startswith('{'):
+                yield json.loads(line)
+
+
+def read_vedro_json(path: str | Path, job_link: str) -> list[Failure]:
+    # stdout of vedro run -r json, one event per line
+    failures = []
+    for event in _json_lines(Path(path)):
+        if event.get('event') != 'scenario_reported' or event['scenario']['status'] != 'FAILED':
+            continue
+        scenario = event['scenario']
+        failed_steps = [step for step in event['steps'] if step.get('error')]
+        if not failed_steps:
+            continue
+        error = failed_steps[-1]['error']
+        test_file = _test_file(scenario['id'], scenario['path'])
+        traceback = ''
+        if error.get('file') and error.get('lineno'):
+            # only last frame of traceback is in json report
+            frame_line = source_line(error['file'], error['lineno'])
+            traceback = f'# {error["file"]}:\n> {error["lineno"]: >3}|{frame_line}'
+        failures.append(_make_failure(
+            test_name=scenario['subject'],
+            test_file=test_file,
+            priority='NOT_SET_PRIORITY',
+            error_type=error['type'],
+            message=error['message'],
+            traceback=traceback,
+            step_name=failed_steps[-1]['name'],
+            job_link=job_link,
+        ))
+    return failures
+
+
+def _trace_step_name(trace: str, test_file: str) -> str:
+    # python traceback text: `File "...", line N, in step`,
+    # first frame of scenario file is the step
+    for line in trace.splitlines():
+        matched = TRACE_FRAME.match(line)
+        if matched and test_file in matched.group('file'):
+            return matched.group('name')
+    return ''
+
+
+def read_allure_results(path: str | Path, job_link: str) -> list[Failure]:
+    failures = []
+    for result_path in sorted(Path(path).glob('*-result.json')):
+        result = json.loads(result_path.read_text(encoding='utf-8'))
+        if result.get('status') not in FAILED_STATUSES:
+            continue
+        labels = {label.get('name'): label.get('value') for label in result.get('labels', [])}
+        details = result.get('statusDetails') or {}
+        message = details.get('message') or ''
+        trace = details.get('trace') or ''
+        matched = ERROR_TYPE.match(message)
+        error_type = matched.group('type') if matched else 'Error'
+        if matched:
+            # allure message is `Type: message`, live failures have message alone
+            message = message[matched.end():].strip()
+        test_file = _test_file(result.get('fullName') or '', labels.get('package') or '')
+        failures.append(_make_failure(
+            test_name=result.get('name') or test_file,
+            test_file=test_file,
+            priority=labels.get('priority') or 'NOT_SET_PRIORITY',
+            error_type=error_type,
+            message=message,
+            traceback=trace.rstrip('\n'),
+            step_name=_trace_step_name(trace, test_file),
+            job_link=job_link,
+        ))
+    return failures
+
+
+def _first_line(path: Path) -> str:
+    with open(path, encoding='utf-8') as results_file:
+        return results_file.readline()
+
+
+def read_results(path: str | Path, job_link: str, results_format: str = 'auto') -> list[Failure]:
+    path = Path(path)
+    if results_format == 'auto':
+        if path.is_dir():
+            results_format = 'allure'
+        elif _first_line(path).startswith('{"test_name"'):
+            results_format = 'spool'
+        else:
+            results_format = 'vedro-json'
+
+    if results_format == 'allure':
+        return read_allure_results(path, job_link)
+    if results_format == 'spool':
+        return read_failures(path)
+    if results_format == 'vedro-json':
+        return read_vedro_json(path, job_link)
+    raise ValueError(f'Unknown results format {results_format!r}')
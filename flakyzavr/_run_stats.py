@@ -0,0 +1,106 @@
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+__all__ = ("RunStats", "percentile",)
+
+
+def percentile(values: list[float], q: float) -> float:
+    # nearest rank, values are sorted
+    if not values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class RunStats:
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._durations: dict[str, list[float]] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        started_at = self._clock()
+        try:
+            yield
+        finally:
+            self.record(phase, self._clock() - started_at)
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self._durations.setdefault(phase, []).append(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            durations = {phase: sorted(values) for phase, values in self._durations.items()}
+            counters = dict(self._counters)
+        return {
+            'phases': {
+                phase: {
+                    'count': len(values),
+                    'total': sum(values),
+                    'p50': percentile(values, 50),
+                    'p95': percentile(values, 95),
+                    'max': values[-1],
+                }
+                for phase, values in durations.items()
+            },
+            'counters': counters,
+        }
+
+    def render_table(self) -> str:
+        snapshot = self.snapshot()
+        lines = [f'{"phase":<16}{"count":>8}{"total":>10}{"p50":>10}{"p95":>10}{"max":>10}']
+        for phase, row in snapshot['phases'].items():
+            lines.append(
+                f'{phase:<16}{row["count"]:>8}{row["total"]:>10.3f}'
+                f'{row["p50"]:>10.3f}{row["p95"]:>10.3f}{row["max"]:>10.3f}'
+            )
+        for name, value in snapshot['counters'].items():
+            lines.append(f'{name:<16}{value:>8}')
+        return '\n'.join(lines)
+
+    def render_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = [
+            '# HELP flakyzavr_phase_seconds Time spent by flakyzavr in reporting phase',
+            '# TYPE flakyzavr_phase_seconds summary',
+        ]
+        for phase, row in snapshot['phases'].items():
+            for quantile, key in (('0.5', 'p50'), ('0.95', 'p95'), ('1', 'max')):
+                lines.append(
+                    f'flakyzavr_phase_seconds{{phase="{phase}",quantile="{quantile}"}} {row[key]}'
+                )
+            lines.append(f'flakyzavr_phase_seconds_sum{{phase="{phase}"}} {row["total"]}')
+            lines.append(f'flakyzavr_phase_seconds_count{{phase="{phase}"}} {row["count"]}')
+        for name, value in snapshot['counters'].items():
+            lines.append(f'# TYPE flakyzavr_{name}_total counter')
+            lines.append(f'flakyzavr_{name}_total {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path: str | Path) -> None:
+        _write_atomic(Path(path), json.dumps(self.snapshot(), indent=2))
+
+    def write_prometheus(self, path: str | Path) -> None:
+        _write_atomic(Path(path), self.render_prometheus())
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    # textfile collector may read the file any moment, so it is replaced at once
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
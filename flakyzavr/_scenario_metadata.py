@@ -0,0 +1,54 @@
+import threading
+from dataclasses import dataclass
+from enum import Enum
+
+from vedro.core import VirtualScenario
+
+__all__ = ("ScenarioMetadata", "ScenarioMetadataCache", "extract_metadata",)
+
+NOT_SET_PRIORITY = 'NOT_SET_PRIORITY'
+
+
+@dataclass(frozen=True)
+class ScenarioMetadata:
+    # allure labels as (name, value), labels of template go first
+    labels: tuple[tuple[str, str], ...] = ()
+    tags: tuple[str, ...] = ()
+
+    def label(self, name: str, default: str | None = None) -> str | None:
+        for label_name, value in self.labels:
+            if label_name == name:
+                return value
+        return default
+
+    @property
+    def priority(self) -> str:
+        priority = self.label('priority')
+        return NOT_SET_PRIORITY if priority is None else priority
+
+
+def extract_metadata(scenario: VirtualScenario) -> ScenarioMetadata:
+    template = getattr(scenario._orig_scenario, "__vedro__template__", None)
+    labels = [
+        *getattr(template, "__vedro__allure_labels__", ()),
+        *getattr(scenario._orig_scenario, "__vedro__allure_labels__", ()),
+    ]
+    return ScenarioMetadata(
+        labels=tuple((label.name, label.value) for label in labels),
+        tags=tuple(str(tag.value) if isinstance(tag, Enum) else str(tag) for tag in scenario.tags),
+    )
+
+
+class ScenarioMetadataCache:
+    def __init__(self) -> None:
+        self._metadata: dict[str, ScenarioMetadata] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scenario: VirtualScenario) -> ScenarioMetadata:
+        unique_id = scenario.unique_id
+        metadata = self._metadata.get(unique_id)
+        if metadata is None:
+            metadata = extract_metadata(scenario)
+            with self._lock:
+                metadata = self._metadata.setdefault(unique_id, metadata)
+        return metadata
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+from flakyzavr._failure import Failure
+from flakyzavr._spool import FailureSpool
+from flakyzavr._spool import read_failures
+
+__all__ = ("ShardStore",)
+
+AGGREGATE_LOCK = 'aggregate.lock'
+
+
+class ShardStore:
+    # every shard appends only to its own file, so shards never contend for a lock
+    def __init__(self, directory: str | Path, shard_id: str) -> None:
+        self._directory = Path(directory)
+        self._shard_id = shard_id
+        self._spool = FailureSpool(self._directory / f'{shard_id}.jsonl')
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def spool(self) -> FailureSpool:
+        return self._spool
+
+    def mark_done(self) -> int:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        (self._directory / f'{self._shard_id}.done').touch()
+        return len(list(self._directory.glob('*.done')))
+
+    def acquire_aggregation(self) -> bool:
+        # shards finishing at the same time may all see every shard done,
+        # only one of them aggregates
+        try:
+            fd = os.open(self._directory / AGGREGATE_LOCK,
+                         os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+    def claim_all(self) -> list[Path]:
+        claimed = []
+        for shard_path in sorted(self._directory.glob('*.jsonl')):
+            claimed_path = FailureSpool(shard_path).claim()
+            if claimed_path is not None:
+                claimed.append(claimed_path)
+        return claimed
+
+    def read_all(self) -> tuple[list[Failure], list[Path]]:
+        claimed = self.claim_all()
+        return [failure for path in claimed for failure in read_failures(path)], claimed
+
+    def cleanup(self, claimed: list[Path]) -> None:
+        for path in [*claimed, *self._directory.glob('*.done'), self._directory / AGGREGATE_LOCK]:
+            path.unlink(missing_ok=True)
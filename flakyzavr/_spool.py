@@ -0,0 +1,44 @@
+import os
+import threading
+from pathlib import Path
+
+from flakyzavr._failure import Failure
+
+__all__ = ("FailureSpool", "read_failures",)
+
+
+def read_failures(path: str | Path) -> list[Failure]:
+    with open(path, encoding='utf-8') as spool_file:
+        return [Failure.from_json(line) for line in spool_file if line.strip()]
+
+
+class FailureSpool:
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def append(self, failures: list[Failure]) -> None:
+        if not failures:
+            return
+        data = ''.join(failure.to_json() + '\n' for failure in failures).encode('utf-8')
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # one O_APPEND write per call, so lines of parallel jobs do not interleave
+            fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+
+    def claim(self) -> Path | None:
+        # spool is moved aside, failures spooled again while replaying go to a fresh file
+        claimed = self._path.with_name(f'{self._path.name}.{os.getpid()}.replay')
+        try:
+            os.replace(self._path, claimed)
+        except FileNotFoundError:
+            return None
+        return claimed
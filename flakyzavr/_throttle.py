@@ -0,0 +1,114 @@
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+from flakyzavr._rate_limit import RateLimiter
+
+__all__ = ("AdaptiveConcurrency", "JiraThrottle", "ThrottleStats", "parse_retry_after",)
+
+
+def parse_retry_after(value: str | None, now: Callable[[], float] = time.time) -> float | None:
+    # Retry-After is either delay in seconds or http date
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - now(), 0.0)
+
+
+class AdaptiveConcurrency:
+    # AIMD: limit grows by one per `limit` successful calls and is halved when jira throttles
+    def __init__(self, maximum: int, minimum: int = 1) -> None:
+        self._maximum = maximum
+        self._minimum = minimum
+        self._limit = float(maximum)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self._limit = max(float(self._minimum), self._limit / 2)
+            else:
+                self._limit = min(float(self._maximum), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+@dataclass
+class ThrottleStats:
+    rate_limit_wait: float = 0.0
+    concurrency_wait: float = 0.0
+    throttled_responses: int = 0
+    retry_after_wait: float = 0.0
+
+
+class JiraThrottle:
+    def __init__(self, rate: float | None = None, burst: int = 1, concurrency: int | None = None,
+                 retries: int = 3, max_retry_after: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self._limiter = RateLimiter(rate, burst=burst, clock=clock, sleep=sleep) if rate else None
+        self._concurrency = AdaptiveConcurrency(concurrency) if concurrency else None
+        self._retries = retries
+        self._max_retry_after = max_retry_after
+        self._clock = clock
+        self._sleep = sleep
+        self._stats = ThrottleStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> ThrottleStats:
+        return self._stats
+
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+    @property
+    def concurrency_limit(self) -> int | None:
+        return self._concurrency.limit if self._concurrency else None
+
+    def acquire(self) -> None:
+        rate_limit_wait = self._limiter.acquire() if self._limiter else 0.0
+        concurrency_wait = 0.0
+        if self._concurrency:
+            started_at = self._clock()
+            self._concurrency.acquire()
+            concurrency_wait = self._clock() - started_at
+        with self._lock:
+            self._stats.rate_limit_wait += rate_limit_wait
+            self._stats.concurrency_wait += concurrency_wait
+
+    def release(self, throttled: bool) -> None:
+        if self._concurrency:
+            self._concurrency.release(throttled)
+
+    def wait_retry_after(self, retry_after: str | None, attempt: int) -> float:
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = float(2 ** attempt)
+        delay = min(delay, self._max_retry_after)
+        with self._lock:
+            self._stats.throttled_responses += 1
+            self._stats.retry_after_wait += delay
+        self._sleep(delay)
+        return delay
@@ -1,5 +1,20 @@
+import os
+from functools import lru_cache
 from types import TracebackType
 from typing import Any
+from typing import Sequence
+
+
+@lru_cache(maxsize=256)
+def _read_lines(filename: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    with open(filename, 'r') as code:
+        return tuple(code.read().splitlines())
+
+
+def _get_lines(filename: str) -> tuple[str, ...]:
+    # keyed by mtime and size so edited files are read again
+    stat = os.stat(filename)
+    return _read_lines(filename, stat.st_mtime_ns, stat.st_size)
 
 
 def list_code(traceback: TracebackType, scenario_path: str) -> str:
@@ -8,28 +23,57 @@ def list_code(traceback: TracebackType, scenario_path: str) -> str:
     firstlineno = f_code.co_firstlineno
     lineno = traceback.tb_frame.f_lineno
 
-    with open(filename, 'r') as code:
-        lines = [
-            f'{">" if idx + 1 == lineno else " "} {str(idx + 1): >3}|{line}'
-            for idx, line in enumerate(code.read().splitlines())
-        ]
-
+    lines = _get_lines(filename)
     if scenario_path not in filename:
-        return '\n'.join(
-            ['# ' + filename + ':'] +
-            lines[lineno - 1:lineno]
-        )
+        indexes = range(len(lines))[lineno - 1:lineno]
+    else:
+        indexes = range(len(lines))[firstlineno - 2:lineno + 3]
 
     return '\n'.join(
         ['# ' + filename + ':'] +
-        lines[firstlineno - 2:lineno + 3]
+        [f'{">" if idx + 1 == lineno else " "} {str(idx + 1): >3}|{lines[idx]}' for idx in indexes]
     )
 
 
-def render_tb(traceback: TracebackType, test_file: str) -> str:
-    if traceback.tb_next:
-        return list_code(traceback, test_file) + '\n\n' + render_tb(traceback.tb_next, test_file)
-    return list_code(traceback, test_file)
+def _limit_frames(frames: list[TracebackType], test_file: str, max_frames: int) -> list[int]:
+    # first and last scenario frames show where scenario called code and where it failed,
+    # rest of the limit goes to head and tail of whole traceback
+    scenario = [
+        idx for idx, frame in enumerate(frames) if test_file in frame.tb_frame.f_code.co_filename
+    ]
+    kept = set((scenario[-1:] + scenario[:1])[:max_frames])
+    head, tail = 0, len(frames) - 1
+    while len(kept) < max_frames:
+        kept.add(head)
+        head += 1
+        if len(kept) < max_frames:
+            kept.add(tail)
+            tail -= 1
+    return sorted(kept)
+
+
+def render_tb(traceback: TracebackType, test_file: str,
+              max_frames: int | None = None, skip_paths: Sequence[str] = ()) -> str:
+    frames = []
+    frame: TracebackType | None = traceback
+    while frame is not None:
+        filename = frame.tb_frame.f_code.co_filename
+        if test_file in filename or not any(path in filename for path in skip_paths):
+            frames.append(frame)
+        frame = frame.tb_next
+
+    kept: Sequence[int] = range(len(frames))
+    if max_frames is not None and len(frames) > max_frames:
+        kept = _limit_frames(frames, test_file, max_frames)
+
+    rendered = []
+    previous = -1
+    for idx in kept:
+        if idx - previous > 1:
+            rendered.append(f'# ... {idx - previous - 1} frames skipped ...')
+        rendered.append(list_code(frames[idx], test_file))
+        previous = idx
+    return '\n\n'.join(rendered)
 
 
 def render_error(error: Any) -> str:
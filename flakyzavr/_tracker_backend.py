@@ -0,0 +1,42 @@
+from typing import Any
+from typing import Protocol
+
+from flakyzavr._jira_stdout import JiraUnavailable
+
+__all__ = ("TrackerBackend",)
+
+
+class TrackerBackend(Protocol):
+    # operations return JiraUnavailable (JiraIssueNotFound for missing issues) instead of raising,
+    # bulk create returns result of every field set at its position
+    @property
+    def connections_opened(self) -> int:
+        ...
+
+    def connect(self) -> Any:
+        ...
+
+    def close(self) -> None:
+        ...
+
+    def search_issues(self, jql_str: str, max_results: int | bool = 50,
+                      fields: str = '*all') -> list[Any] | JiraUnavailable:
+        ...
+
+    def issue(self, key: str, fields: str = '*all') -> Any | JiraUnavailable:
+        ...
+
+    def add_comment(self, issue: Any, comment: str) -> None | JiraUnavailable:
+        ...
+
+    def create_issue(self, fields: dict[str, Any]) -> Any | JiraUnavailable:
+        ...
+
+    def create_issues(self, field_list: list[dict[str, Any]]) -> list[Any | JiraUnavailable]:
+        ...
+
+    def create_issue_link(self, inwardIssue: str, outwardIssue: str) -> None | JiraUnavailable:
+        ...
+
+    def add_attachment(self, issue: Any, filename: str, content: bytes) -> None | JiraUnavailable:
+        ...
@@ -39,4 +39,7 @@ setup(
     package_data={
         'flakyzavr': ['version', 'py.typed'],
     },
+    entry_points={
+        'console_scripts': ['flakyzavr = flakyzavr._cli:main'],
+    },
 )
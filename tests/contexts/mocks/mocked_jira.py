@@ -1,6 +1,7 @@
 import jj
 from jj.http import GET
 from jj.http import POST
+from jj.expiration_policy import ExpireAfterRequests
 from jj.mock import Mocked
 from jj.mock import mocked
 
@@ -57,6 +58,44 @@ def mocked_jira_create(key: str = None) -> Mocked:
         response=jj.Response(status=jira_status, json=jira_response),
     )
 
+def mocked_jira_create_throttled(retry_after: str = '0', times: int = 1) -> Mocked:
+    endpoint = f'/rest/api/2/issue'
+    jira_status = 429
+    return mocked(
+        matcher=jj.match(POST, endpoint),
+        response=jj.Response(status=jira_status, json={}, headers={'Retry-After': retry_after}),
+        expiration_policy=ExpireAfterRequests(times),
+    )
+
+
+def mocked_jira_create_unavailable(times: int = 1) -> Mocked:
+    endpoint = f'/rest/api/2/issue'
+    jira_status = 500
+    return mocked(
+        matcher=jj.match(POST, endpoint),
+        response=jj.Response(status=jira_status, json={}),
+        expiration_policy=ExpireAfterRequests(times),
+    )
+
+
+def mocked_jira_create_bulk(keys: list[str], errors: dict[int, dict[str, str]] = None) -> Mocked:
+    endpoint = f'/rest/api/2/issue/bulk'
+    if errors is None:
+        errors = {}
+    jira_status = 201
+    jira_response = {
+        'issues': [{'id': str(10000 + idx), 'key': key} for idx, key in enumerate(keys)],
+        'errors': [
+            {'status': 400, 'failedElementNumber': idx, 'elementErrors': {'errorMessages': [], 'errors': field_errors}}
+            for idx, field_errors in errors.items()
+        ],
+    }
+    return mocked(
+        matcher=jj.match(POST, endpoint),
+        response=jj.Response(status=jira_status, json=jira_response),
+    )
+
+
 def mocked_jira_create_comment(key: str) -> Mocked:
     endpoint = f'/rest/api/2/issue/{key}/comment'
     jira_status = 201
@@ -69,12 +108,28 @@ def mocked_jira_create_comment(key: str) -> Mocked:
     )
 
 
-def mocked_jira_get_issue(key: str) -> Mocked:
+def mocked_jira_add_attachment(key: str) -> Mocked:
+    endpoint = f'/rest/api/2/issue/{key}/attachments'
+    jira_status = 200
+    jira_response = [{
+        'id': '10001',
+        'filename': 'attachment.txt.gz',
+        'size': 100,
+    }]
+    return mocked(
+        matcher=jj.match(POST, endpoint),
+        response=jj.Response(status=jira_status, json=jira_response),
+    )
+
+
+def mocked_jira_get_issue(key: str, fields: dict = None) -> Mocked:
     endpoint = f'/rest/api/2/issue/{key}'
     jira_status = 200
     jira_response = {
         'key': key,
     }
+    if fields is not None:
+        jira_response['fields'] = fields
     return mocked(
         matcher=jj.match(GET, endpoint),
         response=jj.Response(status=jira_status, json=jira_response),
@@ -0,0 +1,151 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import RU_REPORTING_LANG
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from flakyzavr._fingerprint import signature_hash
+from flakyzavr._fingerprint import text_error_signature
+from jj_d42 import HistorySchema
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            mass_failure_threshold: int = 2
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenarios(self):
+        self.tests_dir = Path('/tmp/tests')
+
+        self.failed_scenarios = []
+        for error_type, error_description in [
+            (ConnectionError, 'Connection refused: 10.0.0.1:5432'),
+            (ConnectionError, 'Connection refused: 10.0.0.2:5433'),
+            (AssertionError, 'Should be equal 1, 3 given'),
+        ]:
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+                error_type=error_type,
+                error_description=error_description,
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def given_failed_scenario_events(self):
+        self.events = [
+            ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result)
+            for failed_scenario in self.failed_scenarios
+        ]
+
+    async def when_vedro_fires_plugin_handlers_and_cleanup(self):
+        with (
+            temp_file(self.failed_scenarios[0].scenario.path, self.failed_scenarios[0].traced_file.file_content),
+            temp_file(self.failed_scenarios[1].scenario.path, self.failed_scenarios[1].traced_file.file_content),
+            temp_file(self.failed_scenarios[2].scenario.path, self.failed_scenarios[2].traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            for event in self.events:
+                self.plugin.on_scenario_failed(event)
+            self.report = Report()
+            self.plugin.on_cleanup(CleanupEvent(self.report))
+
+    async def then_it_should_call_jira_for_search_of_mass_failure_and_single_fail(self):
+        self.signature_label = 'flaky-mass-failure-' + signature_hash(
+            text_error_signature('ConnectionError', 'Connection refused: 10.0.0.1:5432')
+        )
+        self.search_history = self.jira_search_mock.history
+        assert self.search_history == HistorySchema.len(2)
+
+        self.expected_statuses = ','.join(
+            [f'"{status}"' for status in self.plugin_config.jira_search_statuses]
+        )
+        assert [entry['request'].params['jql'] for entry in self.search_history
+                if 'flaky-mass-failure' in entry['request'].params['jql']] == [
+            f'project = {self.plugin_config.jira_project} '
+            f'and status in ({self.expected_statuses}) '
+            f'and labels = flaky-mass-failure '
+            f'and labels = {self.signature_label} '
+            f'ORDER BY created'
+        ]
+
+    async def then_it_should_create_mass_failure_issue_and_issue_for_single_fail(self):
+        self.expected_mass_failure_summary = RU_REPORTING_LANG.MASS_FAILURE_ISSUE_SUMMARY.format(
+            project_name=self.plugin_config.report_project_name,
+            count=2,
+            error_type='ConnectionError',
+        )
+        self.create_history = self.jira_create_mock.history
+        assert self.create_history == HistorySchema.len(2)
+
+        mass_failure_fields, single_fail_fields = sorted(
+            [request['request'].body['fields'] for request in self.create_history],
+            key=lambda fields: 'flaky-mass-failure' not in fields['labels'],
+        )
+        assert mass_failure_fields['summary'] == self.expected_mass_failure_summary
+        assert mass_failure_fields['labels'] == [
+            'new_flaky', 'qa_tech_debt', 'flaky-mass-failure', self.signature_label
+        ]
+        for failed_scenario in self.failed_scenarios[:2]:
+            assert str(failed_scenario.scenario.rel_path) in mass_failure_fields['description']
+
+        assert single_fail_fields['labels'] == ['new_flaky', 'qa_tech_debt', 'flaky']
+
+    async def then_it_should_add_mass_failure_issue_to_summary(self):
+        assert self.report.summary == [
+            RU_REPORTING_LANG.MASS_FAILURE_ISSUE_CREATED.format(
+                count=2,
+                jira_server=self.plugin_config.jira_server,
+                issue_key='WORKSPACE-123',
+            )
+        ]
@@ -0,0 +1,124 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from flakyzavr._cli import main
+from jj_d42 import HistorySchema
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+VEDRO_CONFIG = '''
+import vedro
+import flakyzavr
+
+
+class Config(vedro.Config):
+    class Plugins(vedro.Config.Plugins):
+        class Flakyzavr(flakyzavr.Flakyzavr):
+            enabled = True
+            report_enabled = True
+            jira_server = 'http://mock'
+            jira_token = 'jira_token'
+            jira_project = 'jira_project'
+            jira_components = ['world']
+            report_project_name = 'SomeAppName'
+            dry_run = False
+            spool_path = '{spool_path}'
+'''
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_spool_path(self):
+        self.spool_path = Path(f'/tmp/flakyzavr/spool_{monotonic_ns()}.jsonl')
+
+    async def given_plugin_initialized(self):
+        plugin_spool_path = str(self.spool_path)
+
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            spool_path: str = plugin_spool_path
+            spool_only: bool = True
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenario(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+
+    async def given_vedro_config(self):
+        self.config_path = Path(f'/tmp/flakyzavr/vedro_cfg_{monotonic_ns()}.py')
+        self.config_content = VEDRO_CONFIG.format(spool_path=self.spool_path)
+
+    async def when_failure_is_spooled_and_replayed(self):
+        with (
+            temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content),
+            temp_file(self.config_path, self.config_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            self.plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=self.failed_scenario.scenario_result))
+            self.plugin.on_cleanup(CleanupEvent(Report()))
+            self.spooled_lines = self.spool_path.read_text().splitlines()
+
+            self.exit_code = main(['replay', '--config', str(self.config_path), '--workers', '2'])
+
+    async def then_it_should_spool_failure(self):
+        assert len(self.spooled_lines) == 1
+
+    async def then_it_should_call_jira_only_on_replay(self):
+        assert self.exit_code == 0
+        assert self.jira_search_mock.history == HistorySchema.len(1)
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+
+    async def then_it_should_remove_replayed_spool(self):
+        assert list(self.spool_path.parent.glob(f'{self.spool_path.name}*')) == []
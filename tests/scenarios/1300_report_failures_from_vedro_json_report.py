@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr._cli import main
+from jj_d42 import HistorySchema
+
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+VEDRO_CONFIG = '''
+import vedro
+import flakyzavr
+
+
+class Config(vedro.Config):
+    class Plugins(vedro.Config.Plugins):
+        class Flakyzavr(flakyzavr.Flakyzavr):
+            enabled = True
+            report_enabled = True
+            jira_server = 'http://mock'
+            jira_token = 'jira_token'
+            jira_project = 'jira_project'
+            jira_components = ['world']
+            report_project_name = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id = '4'
+            dry_run = False
+            exceptions = [r'^Connection reset']
+'''
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_vedro_json_report(self):
+        self.scenario_name = fake(ScenarioNameSchema)
+        self.test_file = f'scenarios/scenario_{monotonic_ns()}.py'
+        event = {
+            'event': 'scenario_reported',
+            'scenario': {
+                'id': f'{self.test_file}::Scenario',
+                'subject': self.scenario_name,
+                'path': f'/tmp/tests/{self.test_file}',
+                'status': 'FAILED',
+            },
+            'steps': [
+                {'name': 'given_something', 'status': 'PASSED', 'error': None},
+                {'name': 'then_it_fails', 'status': 'FAILED', 'error': {
+                    'type': 'AssertionError',
+                    'message': 'expected 200, got 500',
+                    'file': f'/tmp/tests/{self.test_file}',
+                    'lineno': 4,
+                }},
+            ],
+        }
+        # exceptions filter matches message alone, as for live failures
+        filtered_test_file = f'scenarios/scenario_{monotonic_ns()}.py'
+        filtered_event = {
+            'event': 'scenario_reported',
+            'scenario': {
+                'id': f'{filtered_test_file}::Scenario',
+                'subject': fake(ScenarioNameSchema),
+                'path': f'/tmp/tests/{filtered_test_file}',
+                'status': 'FAILED',
+            },
+            'steps': [
+                {'name': 'when_it_fails', 'status': 'FAILED', 'error': {
+                    'type': 'ConnectionResetError',
+                    'message': 'Connection reset by peer',
+                    'file': f'/tmp/tests/{filtered_test_file}',
+                    'lineno': 4,
+                }},
+            ],
+        }
+        # same scenario reported by two reruns is reported to jira once
+        self.report_path = Path(f'/tmp/flakyzavr/report_{monotonic_ns()}.jsonl')
+        self.report_content = '\n'.join(
+            json.dumps(item) for item in [{'event': 'startup'}, event, event, filtered_event]
+        )
+
+    async def given_vedro_config(self):
+        self.config_path = Path(f'/tmp/flakyzavr/vedro_cfg_{monotonic_ns()}.py')
+
+    async def when_failures_are_reported_from_report(self):
+        with (
+            temp_file(self.report_path, self.report_content),
+            temp_file(self.config_path, VEDRO_CONFIG),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            self.exit_code = main(['report', str(self.report_path), '--config', str(self.config_path)])
+
+    async def then_it_should_search_issue_once(self):
+        assert self.exit_code == 0
+        assert self.jira_search_mock.history == HistorySchema.len(1)
+
+    async def then_it_should_create_issue_for_failure(self):
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+        fields = self.jira_create_mock.history[0]['request'].body['fields']
+        assert self.scenario_name in fields['summary']
+        assert 'gitlab/4' in fields['description']
+        assert 'expected 200, got 500' in fields['description']
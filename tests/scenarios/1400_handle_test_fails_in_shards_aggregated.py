@@ -0,0 +1,104 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.core import MonotonicScenarioScheduler
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+from vedro.events import StartupEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_shard_dir(self):
+        self.shard_dir = Path(f'/tmp/flakyzavr/shards_{monotonic_ns()}')
+
+    async def given_plugins_of_two_shards(self):
+        plugin_shard_dir = str(self.shard_dir)
+
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            shard_dir: str = plugin_shard_dir
+            shard_count: int = 2
+
+        self.plugins = [
+            FlakyzavrPlugin(config=type(f'_Shard{shard}', (_Flakyzavr,), {'shard_id': str(shard)}))
+            for shard in range(2)
+        ]
+
+    async def given_failed_scenario(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+
+    async def when_scenario_fails_in_both_shards(self):
+        self.shard_files = []
+        with (
+            temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            for plugin in self.plugins:
+                plugin.on_startup(StartupEvent(MonotonicScenarioScheduler([])))
+                plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=self.failed_scenario.scenario_result))
+            self.shard_files = sorted(path.name for path in self.shard_dir.iterdir())
+            for plugin in self.plugins:
+                plugin.on_cleanup(CleanupEvent(Report()))
+
+    async def then_it_should_write_failure_to_file_of_each_shard(self):
+        assert self.shard_files == ['0.jsonl', '1.jsonl']
+
+    async def then_it_should_report_failure_once_from_last_shard(self):
+        assert self.jira_search_mock.history == HistorySchema.len(1)
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+
+    async def then_it_should_clean_shard_dir(self):
+        assert list(self.shard_dir.iterdir()) == []
@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_stats_paths(self):
+        self.stats_json_path = Path(f'/tmp/flakyzavr/stats_{monotonic_ns()}.json')
+        self.stats_prometheus_path = Path(f'/tmp/flakyzavr/stats_{monotonic_ns()}.prom')
+
+    async def given_plugin_initialized(self):
+        stats_json_path = str(self.stats_json_path)
+        stats_prometheus_path = str(self.stats_prometheus_path)
+
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            run_stats: bool = True
+            run_stats_json_path: str = stats_json_path
+            run_stats_prometheus_path: str = stats_prometheus_path
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenario(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+
+    async def when_scenario_fails_and_run_finishes(self):
+        with (
+            temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            self.plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=self.failed_scenario.scenario_result))
+            self.plugin.on_cleanup(CleanupEvent(Report()))
+        self.stats = json.loads(self.stats_json_path.read_text())
+        self.prometheus_stats = self.stats_prometheus_path.read_text()
+        self.stats_json_path.unlink()
+        self.stats_prometheus_path.unlink()
+
+    async def then_it_should_write_phase_timings(self):
+        assert set(self.stats['phases']) == {'filter', 'render_tb', 'connect', 'search', 'create'}
+        for phase in self.stats['phases'].values():
+            assert phase['count'] == 1
+            assert phase['p50'] <= phase['p95'] <= phase['max']
+
+    async def then_it_should_write_http_counters(self):
+        # search, fields lookup and create with fetch of created issue, connect is timed only
+        assert self.stats['counters']['http_calls'] == 4
+        assert self.stats['counters']['request_bytes'] > 0
+        assert self.stats['counters']['response_bytes'] > 0
+
+    async def then_it_should_write_prometheus_textfile(self):
+        assert 'flakyzavr_phase_seconds_count{phase="create"} 1' in self.prometheus_stats
+        assert 'flakyzavr_http_calls_total 4' in self.prometheus_stats
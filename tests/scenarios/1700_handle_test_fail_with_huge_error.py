@@ -0,0 +1,99 @@
+import zlib
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_add_attachment
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            jira_error_max_bytes: int = 2000
+            jira_traceback_max_bytes: int = 4000
+            jira_attach_truncated: bool = True
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenario_with_huge_error(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.error_description = 'Should be equal\n' + '\n'.join(f'- line {idx}' for idx in range(10000))
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+            error_description=self.error_description,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+
+    async def when_vedro_fires_plugin_handler(self):
+        with (
+            temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+            mocked_jira_add_attachment(key='WORKSPACE-123') as self.jira_add_attachment_mock,
+        ):
+            self.plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=self.failed_scenario.scenario_result))
+
+    async def then_it_should_create_issue_with_truncated_error(self):
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+        description = self.jira_create_mock.history[0]['request'].body['fields']['description']
+        assert len(description.encode('utf-8')) < 8000
+        assert 'bytes truncated' in description
+        assert 'Should be equal' in description
+        assert '- line 9999' in description
+        assert f'# {self.tests_dir / self.scenario_project_filename}:' in description
+
+    async def then_it_should_attach_full_error_once(self):
+        assert self.jira_add_attachment_mock.history == HistorySchema.len(1)
+        body = self.jira_add_attachment_mock.history[0]['request'].body
+        # multipart body, gzip stream is followed by closing boundary
+        content = zlib.decompressobj(wbits=31).decompress(body[body.index(b'\x1f\x8b'):]).decode('utf-8')
+        assert self.error_description in content
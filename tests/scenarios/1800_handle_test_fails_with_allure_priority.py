@@ -0,0 +1,106 @@
+from collections import namedtuple
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.events import ScenarioFailedEvent
+
+from contexts.issue_summary import issue_summary
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_create_comment
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+AllureLabel = namedtuple('AllureLabel', ['name', 'value'])
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenario_with_allure_priority(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_name = fake(ScenarioNameSchema)
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=self.scenario_name,
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+        self.failed_scenario.scenario._orig_scenario.__vedro__allure_labels__ = (
+            AllureLabel('feature', 'payments'),
+            AllureLabel('priority', 'P1'),
+        )
+
+    async def when_scenario_fails_twice(self):
+        with (
+            temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+            mocked_jira_create_comment(key='WORKSPACE-123') as self.jira_create_comment_mock,
+        ):
+            for _ in range(2):
+                self.plugin.on_scenario_failed(
+                    ScenarioFailedEvent(scenario_result=self.failed_scenario.scenario_result)
+                )
+
+    async def then_it_should_create_issue_with_allure_priority(self):
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+        fields = self.jira_create_mock.history[0]['request'].body['fields']
+        assert fields['summary'] == issue_summary(
+            test_name=self.scenario_name,
+            project_name=self.plugin_config.report_project_name,
+            priority='P1',
+        )
+
+    async def then_it_should_comment_with_allure_priority(self):
+        assert self.jira_create_comment_mock.history == HistorySchema.len(1)
+        assert 'P1' in self.jira_create_comment_mock.history[0]['request'].body['body']
+
+    async def then_it_should_extract_scenario_metadata_once(self):
+        metadata = self.plugin._scenario_metadata.get(self.failed_scenario.scenario)
+        assert metadata.label('feature') == 'payments'
+        assert len(self.plugin._scenario_metadata._metadata) == 1
@@ -0,0 +1,113 @@
+import sqlite3
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+from vedro.events import ScenarioPassedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_history_path(self):
+        self.history_path = Path(f'/tmp/flakyzavr/history_{monotonic_ns()}.sqlite')
+
+    async def given_plugin_config(self):
+        plugin_history_path = str(self.history_path)
+
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            flaky_history_path: str = plugin_history_path
+            flaky_min_fail_rate: float = 0.5
+            flaky_history_min_runs: int = 2
+
+        self.plugin_config = _Flakyzavr
+
+    async def given_failed_scenario(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+
+    async def when_scenario_mostly_passes_in_first_run_and_fails_in_second(self):
+        scenario_result = self.failed_scenario.scenario_result
+        with (
+            temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            first_run = FlakyzavrPlugin(config=self.plugin_config)
+            for _ in range(3):
+                first_run.on_scenario_passed(ScenarioPassedEvent(scenario_result=scenario_result))
+            first_run.on_scenario_failed(ScenarioFailedEvent(scenario_result=scenario_result))
+            first_run.on_cleanup(CleanupEvent(Report()))
+
+            second_run = FlakyzavrPlugin(config=self.plugin_config)
+            for _ in range(2):
+                second_run.on_scenario_failed(ScenarioFailedEvent(scenario_result=scenario_result))
+            second_run.on_cleanup(CleanupEvent(Report()))
+
+        connection = sqlite3.connect(self.history_path)
+        self.stored_outcomes = connection.execute('SELECT outcomes FROM outcomes').fetchall()
+        connection.close()
+        self.history_path.unlink()
+
+    async def then_it_should_skip_failures_below_fail_rate(self):
+        skipped = [details for details in self.failed_scenario.scenario_result.extra_details
+                   if details.startswith('Пропускаем заведение тикета')]
+        assert len(skipped) == 2
+
+    async def then_it_should_report_failure_above_fail_rate_once(self):
+        assert self.jira_search_mock.history == HistorySchema.len(1)
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+
+    async def then_it_should_store_outcomes_of_both_runs(self):
+        assert self.stored_outcomes == [('PPPFFF',)]
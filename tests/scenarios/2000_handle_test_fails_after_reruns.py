@@ -0,0 +1,95 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.core import AggregatedResult
+from vedro.core import ScenarioResult
+from vedro.events import ScenarioReportedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            report_after_reruns: bool = True
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_scenario_failed_twice_of_three_attempts(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+        failed_attempt = self.failed_scenario.scenario_result.mark_failed()
+        passed_attempt = ScenarioResult(self.failed_scenario.scenario).mark_passed()
+        self.aggregated_result = AggregatedResult.from_existing(
+            failed_attempt, [failed_attempt, passed_attempt, failed_attempt]
+        )
+
+    async def when_vedro_reports_scenario(self):
+        with (
+            temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            self.plugin.on_scenario_reported(ScenarioReportedEvent(self.aggregated_result))
+
+    async def then_it_should_report_scenario_once(self):
+        assert self.jira_search_mock.history == HistorySchema.len(1)
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+
+    async def then_it_should_describe_failed_attempts(self):
+        description = self.jira_create_mock.history[0]['request'].body['fields']['description']
+        assert description.endswith('Упал в 2 из 3 попыток')
+
+    async def then_it_should_add_details_to_reported_result(self):
+        assert 'Упал в 2 из 3 попыток' in self.aggregated_result.extra_details
+        assert any('WORKSPACE-123' in details for details in self.aggregated_result.extra_details)
@@ -0,0 +1,91 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import FakeTracker
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+def make_plugin_config(tracker: FakeTracker) -> type[Flakyzavr]:
+    class _Flakyzavr(Flakyzavr):
+        enabled = True
+
+        report_enabled = False  # enable it when flaky run
+
+        jira_server: str = 'http://fake'
+        jira_token: str = 'jira_token'
+        jira_project: str = 'jira_project'
+        jira_components: list[str] = ['world']
+        jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+        jira_flaky_label: str = 'flaky'
+
+        jira_additional_data: dict[str, str] = {}
+        jira_issue_type_id: str = '3'
+        report_project_name: str = 'SomeAppName'
+        job_path = 'gitlab/{job_id}'
+        job_id: str = '4'
+
+        dry_run: bool = False
+
+        exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+        def tracker_backend() -> FakeTracker:
+            return tracker
+
+    return _Flakyzavr
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_trackers(self):
+        self.tracker = FakeTracker()
+        self.unavailable_tracker = FakeTracker(failing_operations=('search',))
+
+    async def given_failed_scenario(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+
+    async def when_scenario_fails_in_two_runs_and_once_with_unavailable_tracker(self):
+        scenario_result = self.failed_scenario.scenario_result
+        with temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content):
+            for tracker in (self.tracker, self.tracker, self.unavailable_tracker):
+                plugin = FlakyzavrPlugin(config=make_plugin_config(tracker))
+                plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=scenario_result))
+                plugin.on_cleanup(CleanupEvent(Report()))
+
+    async def then_it_should_create_issue_in_first_run(self):
+        assert len(self.tracker.issues) == 1
+        issue = next(iter(self.tracker.issues.values()))
+        assert str(self.scenario_project_filename) in issue.fields.description
+        assert 'flaky' in issue.fields.labels
+
+    async def then_it_should_comment_issue_in_second_run(self):
+        assert list(self.tracker.comments) == list(self.tracker.issues)
+        assert len(self.tracker.comments[next(iter(self.tracker.issues))]) == 1
+
+    async def then_it_should_skip_reporting_when_tracker_unavailable(self):
+        assert self.unavailable_tracker.issues == {}
+        skipped = [details for details in self.failed_scenario.scenario_result.extra_details
+                   if 'не был доступен во время поиска тикетов' in details]
+        assert len(skipped) == 1
@@ -0,0 +1,107 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_create_bulk
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            jira_search_batch_size: int = 3
+            jira_bulk_create_size: int = 3
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenarios(self):
+        self.tests_dir = Path('/tmp/tests')
+
+        self.failed_scenarios = []
+        for _ in range(3):
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def when_vedro_fires_plugin_handler_for_each_fail(self):
+        with (
+            temp_file(self.failed_scenarios[0].scenario.path, self.failed_scenarios[0].traced_file.file_content),
+            temp_file(self.failed_scenarios[1].scenario.path, self.failed_scenarios[1].traced_file.file_content),
+            temp_file(self.failed_scenarios[2].scenario.path, self.failed_scenarios[2].traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_create_bulk(
+                keys=['WORKSPACE-1', 'WORKSPACE-3'],
+                errors={1: {'components': 'Component name is not valid'}},
+            ) as self.jira_create_bulk_mock,
+        ):
+            for failed_scenario in self.failed_scenarios:
+                self.plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result))
+            self.plugin.on_cleanup(CleanupEvent(Report()))
+
+    async def then_it_should_create_issues_with_one_bulk_request(self):
+        assert self.jira_create_mock.history == HistorySchema.len(0)
+        assert self.jira_create_bulk_mock.history == HistorySchema.len(1)
+        body = self.jira_create_bulk_mock.history[0]['request'].body
+        assert [
+            str(failed_scenario.scenario.rel_path) in issue['fields']['description']
+            for failed_scenario, issue in zip(self.failed_scenarios, body['issueUpdates'])
+        ] == [True, True, True]
+
+    async def then_it_should_map_created_issues_to_their_scenarios(self):
+        assert self.failed_scenarios[0].scenario_result.extra_details[-1].endswith('/browse/WORKSPACE-1')
+        assert self.failed_scenarios[2].scenario_result.extra_details[-1].endswith('/browse/WORKSPACE-3')
+
+    async def then_it_should_add_rejection_errors_to_rejected_scenario(self):
+        assert self.failed_scenarios[1].scenario_result.extra_details[-1] == (
+            'http://mock отклонил флаки тикет для текущего теста: components: Component name is not valid'
+        )
@@ -0,0 +1,54 @@
+import vedro
+from flakyzavr._circuit_breaker import CircuitBreaker
+from flakyzavr._jira_stdout import JiraUnavailable
+from flakyzavr._jira_stdout import LazyJiraTrier
+from flakyzavr._throttle import JiraThrottle
+from jj_d42 import HistorySchema
+
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_create_throttled
+from contexts.mocks.mocked_jira import mocked_jira_create_unavailable
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_jira_client_with_circuit_breaker(self):
+        self.circuit_breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+        self.jira = LazyJiraTrier(
+            'http://mock',
+            token='jira_token',
+            circuit_breaker=self.circuit_breaker,
+            throttle=JiraThrottle(retries=0),
+        )
+        self.fields = {'project': {'key': 'jira_project'}, 'summary': 'flaky', 'issuetype': {'id': '3'}}
+
+    async def when_jira_fails_then_throttles_probe_then_recovers(self):
+        with (
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_create_throttled() as self.jira_create_throttled_mock,
+            mocked_jira_create_unavailable() as self.jira_create_unavailable_mock,
+        ):
+            self.failed = self.jira.create_issue(self.fields)
+            self.state_after_failure = self.circuit_breaker.state
+            self.throttled = self.jira.create_issue(self.fields)
+            self.state_after_throttled_probe = self.circuit_breaker.state
+            self.created = self.jira.create_issue(self.fields)
+
+    async def then_it_should_open_circuit_on_server_error(self):
+        assert isinstance(self.failed, JiraUnavailable)
+        assert self.state_after_failure == CircuitBreaker.OPEN
+
+    async def then_it_should_close_circuit_on_throttled_probe(self):
+        assert isinstance(self.throttled, JiraUnavailable)
+        assert self.jira_create_throttled_mock.history == HistorySchema.len(1)
+        assert self.state_after_throttled_probe == CircuitBreaker.CLOSED
+
+    async def then_it_should_keep_calling_jira_after_probe(self):
+        assert self.created.key == 'WORKSPACE-123'
+        assert self.jira_create_mock.history == HistorySchema.len(1)
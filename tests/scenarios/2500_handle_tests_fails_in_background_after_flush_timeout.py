@@ -0,0 +1,94 @@
+from pathlib import Path
+from time import monotonic
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import FakeTracker
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from flakyzavr._spool import read_failures
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_slow_tracker(self):
+        self.tracker = FakeTracker(latency=0.5)
+        self.spool_path = Path(f'/tmp/flakyzavr/spool_{monotonic_ns()}.jsonl')
+
+    async def given_plugin_initialized(self):
+        plugin_tracker = self.tracker
+        plugin_spool_path = str(self.spool_path)
+
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://fake'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            report_async: bool = True
+            report_workers: int = 1
+            report_flush_timeout: float = 0.1
+            spool_path: str = plugin_spool_path
+
+            def tracker_backend() -> FakeTracker:
+                return plugin_tracker
+
+        self.plugin = FlakyzavrPlugin(config=_Flakyzavr)
+
+    async def given_failed_scenarios(self):
+        self.tests_dir = Path('/tmp/tests')
+
+        self.failed_scenarios = []
+        for _ in range(3):
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def when_cleanup_times_out_while_reporting(self):
+        with (
+            temp_file(self.failed_scenarios[0].scenario.path, self.failed_scenarios[0].traced_file.file_content),
+            temp_file(self.failed_scenarios[1].scenario.path, self.failed_scenarios[1].traced_file.file_content),
+            temp_file(self.failed_scenarios[2].scenario.path, self.failed_scenarios[2].traced_file.file_content),
+        ):
+            for failed_scenario in self.failed_scenarios:
+                self.plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result))
+            started_at = monotonic()
+            self.plugin.on_cleanup(CleanupEvent(Report()))
+            self.cleanup_duration = monotonic() - started_at
+        self.spooled = read_failures(self.spool_path)
+        self.spool_path.unlink()
+
+    async def then_it_should_not_wait_for_failure_in_progress_after_timeout(self):
+        # first failure is in progress for at least one tracker call of 0.5s
+        assert self.cleanup_duration < 0.4
+
+    async def then_it_should_spool_failures_not_reported_before_timeout(self):
+        assert sorted(failure.test_file for failure in self.spooled) == sorted(
+            str(failed_scenario.scenario.rel_path) for failed_scenario in self.failed_scenarios
+        )
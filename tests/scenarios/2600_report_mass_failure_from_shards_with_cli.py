@@ -0,0 +1,126 @@
+import shutil
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from flakyzavr._cli import main
+from jj_d42 import HistorySchema
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+VEDRO_CONFIG = '''
+import vedro
+import flakyzavr
+
+
+class Config(vedro.Config):
+    class Plugins(vedro.Config.Plugins):
+        class Flakyzavr(flakyzavr.Flakyzavr):
+            enabled = True
+            report_enabled = True
+            jira_server = 'http://mock'
+            jira_token = 'jira_token'
+            jira_project = 'jira_project'
+            jira_components = ['world']
+            report_project_name = 'SomeAppName'
+            dry_run = False
+            spool_path = '{spool_path}'
+            shard_dir = '{shard_dir}'
+            mass_failure_threshold = 3
+'''
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_paths(self):
+        self.shard_dir = Path(f'/tmp/flakyzavr/shards_{monotonic_ns()}')
+        self.spool_path = Path(f'/tmp/flakyzavr/spool_{monotonic_ns()}.jsonl')
+        self.config_path = Path(f'/tmp/flakyzavr/vedro_cfg_{monotonic_ns()}.py')
+        self.config_content = VEDRO_CONFIG.format(spool_path=self.spool_path, shard_dir=self.shard_dir)
+
+    async def given_shard_plugin(self):
+        plugin_shard_dir = str(self.shard_dir)
+
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            report_project_name: str = 'SomeAppName'
+
+            dry_run: bool = False
+
+            shard_dir: str = plugin_shard_dir
+            shard_id: str = 'shard'
+
+        self.plugin = FlakyzavrPlugin(config=_Flakyzavr)
+
+    async def given_failed_scenarios_with_same_error(self):
+        self.tests_dir = Path('/tmp/tests')
+
+        self.failed_scenarios = []
+        for _ in range(3):
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def when_shard_failures_are_replayed_and_aggregated(self):
+        with (
+            temp_file(self.failed_scenarios[0].scenario.path, self.failed_scenarios[0].traced_file.file_content),
+            temp_file(self.failed_scenarios[1].scenario.path, self.failed_scenarios[1].traced_file.file_content),
+            temp_file(self.failed_scenarios[2].scenario.path, self.failed_scenarios[2].traced_file.file_content),
+            temp_file(self.config_path, self.config_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            for failed_scenario in self.failed_scenarios:
+                self.plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result))
+            self.plugin.on_cleanup(CleanupEvent(Report()))
+            shutil.copy(self.shard_dir / 'shard.jsonl', self.spool_path)
+
+            self.replay_exit_code = main(['replay', '--config', str(self.config_path)])
+            self.shard_files_after_replay = sorted(path.name for path in self.shard_dir.iterdir())
+            self.aggregate_exit_code = main(['aggregate', '--config', str(self.config_path)])
+
+    async def then_it_should_not_mark_replay_as_finished_shard(self):
+        assert self.replay_exit_code == 0
+        assert self.shard_files_after_replay == ['shard.done', 'shard.jsonl']
+
+    async def then_it_should_report_one_mass_failure_issue_from_each_command(self):
+        assert self.aggregate_exit_code == 0
+        assert self.jira_search_mock.history == HistorySchema.len(2)
+        assert self.jira_create_mock.history == HistorySchema.len(2)
+        for entry in self.jira_create_mock.history:
+            assert 'flaky-mass-failure' in entry['request'].body['fields']['labels']
+
+    async def then_it_should_clean_shard_dir(self):
+        assert list(self.shard_dir.iterdir()) == []
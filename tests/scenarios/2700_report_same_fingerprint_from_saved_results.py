@@ -0,0 +1,128 @@
+import json
+import traceback
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from flakyzavr._result_readers import read_allure_results
+from flakyzavr._result_readers import read_vedro_json
+from flakyzavr._spool import read_failures
+from vedro.core import ExcInfo
+from vedro.core import ScenarioResult
+from vedro.core import StepResult
+from vedro.core import VirtualScenario
+from vedro.core import VirtualStep
+from vedro.events import ScenarioFailedEvent
+
+from helpers.temp_file import temp_file
+
+SCENARIO_SOURCE = '''\
+def when_user_calls_service(call_service):
+    call_service()
+'''
+CLIENT_SOURCE = '''\
+def call_service():
+    raise ConnectionError("boom 42")
+'''
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_paths(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.test_file = f'scenarios/scenario_{monotonic_ns()}.py'
+        self.client_path = self.tests_dir / f'clients/client_{monotonic_ns()}.py'
+        self.spool_path = Path(f'/tmp/flakyzavr/spool_{monotonic_ns()}.jsonl')
+        self.report_path = Path(f'/tmp/flakyzavr/report_{monotonic_ns()}.jsonl')
+        self.allure_dir = Path(f'/tmp/flakyzavr/allure_{monotonic_ns()}')
+
+    async def given_plugin_initialized(self):
+        plugin_spool_path = str(self.spool_path)
+
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_project: str = 'jira_project'
+            report_project_name: str = 'SomeAppName'
+
+            dry_run: bool = False
+
+            spool_path: str = plugin_spool_path
+            spool_only: bool = True
+
+        self.plugin = FlakyzavrPlugin(config=_Flakyzavr)
+
+    async def when_error_raised_outside_scenario_file_is_reported_live_and_saved(self):
+        scenario_path = self.tests_dir / self.test_file
+        with (
+            temp_file(scenario_path, SCENARIO_SOURCE),
+            temp_file(self.client_path, CLIENT_SOURCE),
+        ):
+            scenario_namespace, client_namespace = {}, {}
+            exec(compile(SCENARIO_SOURCE, str(scenario_path), 'exec'), scenario_namespace)
+            exec(compile(CLIENT_SOURCE, str(self.client_path), 'exec'), client_namespace)
+            step = scenario_namespace['when_user_calls_service']
+            try:
+                step(client_namespace['call_service'])
+            except ConnectionError as error:
+                exc_info = ExcInfo(type(error), error, error.__traceback__.tb_next)
+
+            class _Scenario(vedro.Scenario):
+                subject = 'user calls service'
+                __file__ = str(scenario_path)
+
+            scenario_result = ScenarioResult(VirtualScenario(_Scenario, steps=[], project_dir=self.tests_dir))
+            step_result = StepResult(VirtualStep(step))
+            step_result.set_exc_info(exc_info)
+            scenario_result.add_step_result(step_result)
+            self.plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=scenario_result))
+            self.live_failures = read_failures(self.spool_path)
+
+            last_frame = exc_info.traceback
+            while last_frame.tb_next is not None:
+                last_frame = last_frame.tb_next
+            vedro_event = {
+                'event': 'scenario_reported',
+                'scenario': {
+                    'id': scenario_result.scenario.unique_id,
+                    'subject': 'user calls service',
+                    'path': str(scenario_path),
+                    'status': 'FAILED',
+                },
+                'steps': [{'name': 'when_user_calls_service', 'status': 'FAILED', 'error': {
+                    'type': 'ConnectionError',
+                    'message': 'boom 42',
+                    'file': last_frame.tb_frame.f_code.co_filename,
+                    'lineno': last_frame.tb_lineno,
+                }}],
+            }
+            allure_result = {
+                'name': 'user calls service',
+                'fullName': scenario_result.scenario.unique_id,
+                'status': 'broken',
+                'statusDetails': {
+                    'message': 'ConnectionError: boom 42',
+                    'trace': ''.join(traceback.format_exception(exc_info.type, exc_info.value, exc_info.traceback)),
+                },
+                'labels': [],
+            }
+            with (
+                temp_file(self.report_path, json.dumps(vedro_event)),
+                temp_file(self.allure_dir / 'uuid-result.json', json.dumps(allure_result)),
+            ):
+                self.vedro_json_failures = read_vedro_json(self.report_path, 'job')
+                self.allure_failures = read_allure_results(self.allure_dir, 'job')
+        self.spool_path.unlink()
+
+    async def then_it_should_read_same_failure_signature(self):
+        assert self.vedro_json_failures[0].error_signature == self.live_failures[0].error_signature
+        assert self.allure_failures[0].error_signature == self.live_failures[0].error_signature
+
+    async def then_it_should_read_same_fingerprint(self):
+        assert self.vedro_json_failures[0].fingerprint == self.live_failures[0].fingerprint
+        assert self.allure_failures[0].fingerprint == self.live_failures[0].fingerprint
@@ -0,0 +1,110 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import FakeTracker
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from vedro.core import MonotonicScenarioScheduler
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+from vedro.events import StartupEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+def make_plugin_config(tracker: FakeTracker) -> type[Flakyzavr]:
+    class _Flakyzavr(Flakyzavr):
+        enabled = True
+
+        report_enabled = False  # enable it when flaky run
+
+        jira_server: str = 'http://fake'
+        jira_token: str = 'jira_token'
+        jira_project: str = 'jira_project'
+        jira_components: list[str] = ['world']
+        jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+        jira_flaky_label: str = 'flaky'
+
+        jira_additional_data: dict[str, str] = {}
+        jira_issue_type_id: str = '3'
+        report_project_name: str = 'SomeAppName'
+        job_path = 'gitlab/{job_id}'
+        job_id: str = '4'
+
+        dry_run: bool = False
+
+        exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+        jira_prefetch_issues: bool = True
+        mass_failure_threshold: int = 2
+
+        def tracker_backend() -> FakeTracker:
+            return tracker
+
+    return _Flakyzavr
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_tracker(self):
+        self.tracker = FakeTracker()
+
+    async def given_failed_scenarios(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.failed_scenarios = []
+        for _ in range(3):
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+                error_type=ConnectionError,
+                error_description='Connection refused: 10.0.0.1:5432',
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def given_mass_failure_reported(self):
+        plugin = FlakyzavrPlugin(config=make_plugin_config(self.tracker))
+        for failed_scenario in self.failed_scenarios:
+            with temp_file(failed_scenario.scenario.path, failed_scenario.traced_file.file_content):
+                plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result))
+        plugin.on_cleanup(CleanupEvent(Report()))
+        self.mass_failure_key = next(iter(self.tracker.issues))
+
+    async def when_one_of_scenarios_fails_alone_in_next_run(self):
+        failed_scenario = self.failed_scenarios[0]
+        failed_scenario.scenario_result.extra_details.clear()
+        plugin = FlakyzavrPlugin(config=make_plugin_config(self.tracker))
+        plugin.on_startup(StartupEvent(MonotonicScenarioScheduler([])))
+        with temp_file(failed_scenario.scenario.path, failed_scenario.traced_file.file_content):
+            plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result))
+        plugin.on_cleanup(CleanupEvent(Report()))
+
+    async def then_mass_failure_issue_should_not_have_flaky_label(self):
+        labels = self.tracker.issues[self.mass_failure_key].fields.labels
+        assert labels[:3] == ['new_flaky', 'qa_tech_debt', 'flaky-mass-failure']
+        assert 'flaky' not in labels
+
+    async def then_it_should_create_flaky_issue_of_scenario(self):
+        assert len(self.tracker.issues) == 2
+        issue = self.tracker.issues[list(self.tracker.issues)[1]]
+        assert str(self.failed_scenarios[0].scenario.rel_path) in issue.fields.description
+        assert 'flaky' in issue.fields.labels
+
+    async def then_it_should_search_issue_not_found_in_prefetched_index(self):
+        # mass failure search of first run, prefetch and search of scenario in next run
+        assert self.tracker.calls['search'] == 3
+
+    async def then_it_should_not_comment_mass_failure_issue(self):
+        assert self.mass_failure_key not in self.tracker.comments
@@ -0,0 +1,93 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import EN_REPORTING_LANG
+from flakyzavr import FakeTracker
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from vedro.core import MonotonicScenarioScheduler
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+from vedro.events import StartupEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+def make_plugin_config(tracker: FakeTracker) -> type[Flakyzavr]:
+    class _Flakyzavr(Flakyzavr):
+        enabled = True
+
+        report_enabled = False  # enable it when flaky run
+
+        jira_server: str = 'http://fake'
+        jira_token: str = 'jira_token'
+        jira_project: str = 'jira_project'
+        jira_components: list[str] = ['world']
+        jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+        jira_flaky_label: str = 'flaky'
+
+        jira_additional_data: dict[str, str] = {}
+        jira_issue_type_id: str = '3'
+        report_project_name: str = 'SomeAppName'
+        job_path = 'gitlab/{job_id}'
+        job_id: str = '4'
+
+        dry_run: bool = False
+
+        exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+        reporting_language = EN_REPORTING_LANG
+        jira_prefetch_issues: bool = True
+
+        def tracker_backend() -> FakeTracker:
+            return tracker
+
+    return _Flakyzavr
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_tracker(self):
+        self.tracker = FakeTracker()
+
+    async def given_failed_scenario(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.traced_file = mocked_traced_file(
+            filename=self.tests_dir / self.scenario_project_filename,
+            line_start=2,
+            line_target=4,
+        )
+        self.failed_scenario = mocked_failed_scenario_result(
+            scenario_name=fake(ScenarioNameSchema),
+            scenario_project_filename=self.scenario_project_filename,
+            traced_file=self.traced_file,
+            tests_dir=self.tests_dir,
+        )
+
+    async def when_scenario_fails_in_two_runs(self):
+        scenario_result = self.failed_scenario.scenario_result
+        with temp_file(self.failed_scenario.scenario.path, self.failed_scenario.traced_file.file_content):
+            for _ in range(2):
+                plugin = FlakyzavrPlugin(config=make_plugin_config(self.tracker))
+                plugin.on_startup(StartupEvent(MonotonicScenarioScheduler([])))
+                plugin.on_scenario_failed(ScenarioFailedEvent(scenario_result=scenario_result))
+                plugin.on_cleanup(CleanupEvent(Report()))
+
+    async def then_it_should_create_issue_without_test_file_line(self):
+        assert len(self.tracker.issues) == 1
+        issue = next(iter(self.tracker.issues.values()))
+        assert f'\n{self.scenario_project_filename}\n' not in issue.fields.description
+
+    async def then_it_should_find_issue_in_prefetched_index_of_second_run(self):
+        # prefetch and search of test file in first run, only prefetch in second one
+        assert self.tracker.calls['search'] == 3
+
+    async def then_it_should_comment_issue_in_second_run(self):
+        assert list(self.tracker.comments) == list(self.tracker.issues)
@@ -0,0 +1,34 @@
+import vedro
+from flakyzavr._payload_budget import truncate_text
+from flakyzavr._payload_budget import truncate_traceback
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_long_error_and_traceback(self):
+        self.test_file = 'scenarios/scenario.py'
+        self.error = 'AssertionError: ' + 'ж' * 50
+        self.traceback = '\n\n'.join(
+            f'# /tmp/tests/{self.test_file if idx % 3 == 0 else "helpers/helper.py"}:\n'
+            + '\n'.join(f'    {line_no}|line {line_no} of frame {idx}' for line_no in range(10))
+            for idx in range(30)
+        )
+
+    async def when_they_are_truncated_to_budgets(self):
+        self.truncated_errors = {max_bytes: truncate_text(self.error, max_bytes) for max_bytes in (10, 40, 100)}
+        self.truncated_tracebacks = {
+            max_bytes: truncate_traceback(self.traceback, max_bytes, self.test_file)
+            for max_bytes in (20, 1000, 5000)
+        }
+
+    async def then_truncated_errors_should_fit_budget(self):
+        for max_bytes, truncated in self.truncated_errors.items():
+            assert len(truncated.encode('utf-8')) <= max_bytes
+
+    async def then_truncated_tracebacks_should_fit_budget(self):
+        for max_bytes, truncated in self.truncated_tracebacks.items():
+            assert len(truncated.encode('utf-8')) <= max_bytes
+
+    async def then_it_should_mark_truncated_part(self):
+        assert ' bytes truncated ...' in self.truncated_errors[100]
+        assert ' frames skipped ...' in self.truncated_tracebacks[5000]
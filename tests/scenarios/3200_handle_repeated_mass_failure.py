@@ -0,0 +1,110 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import EN_REPORTING_LANG
+from flakyzavr import FakeTracker
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+def make_plugin_config(tracker: FakeTracker) -> type[Flakyzavr]:
+    class _Flakyzavr(Flakyzavr):
+        enabled = True
+
+        report_enabled = False  # enable it when flaky run
+
+        jira_server: str = 'http://fake'
+        jira_token: str = 'jira_token'
+        jira_project: str = 'jira_project'
+        jira_components: list[str] = ['world']
+        jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+        jira_flaky_label: str = 'flaky'
+
+        jira_additional_data: dict[str, str] = {}
+        jira_issue_type_id: str = '3'
+        report_project_name: str = 'SomeAppName'
+        job_path = 'gitlab/{job_id}'
+        job_id: str = '4'
+
+        dry_run: bool = False
+        reporting_language = EN_REPORTING_LANG
+
+        exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+        mass_failure_threshold: int = 2
+
+        def tracker_backend() -> FakeTracker:
+            return tracker
+
+    return _Flakyzavr
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_tracker(self):
+        self.tracker = FakeTracker()
+
+    async def given_failed_scenarios(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.failed_scenarios = []
+        for index in range(3):
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+                error_type=ConnectionError,
+                # masked message, so each run of same outage has same signature
+                error_description=f'Connection refused: 10.0.0.{index}:5432',
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def when_same_outage_fails_scenarios_in_three_runs(self):
+        self.reports = []
+        for _ in range(3):
+            plugin = FlakyzavrPlugin(config=make_plugin_config(self.tracker))
+            for failed_scenario in self.failed_scenarios:
+                failed_scenario.scenario_result.extra_details.clear()
+                with temp_file(failed_scenario.scenario.path,
+                               failed_scenario.traced_file.file_content):
+                    plugin.on_scenario_failed(
+                        ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result)
+                    )
+            report = Report()
+            plugin.on_cleanup(CleanupEvent(report))
+            self.reports.append(report)
+
+    async def then_it_should_create_one_mass_failure_issue(self):
+        assert len(self.tracker.issues) == 1
+        self.mass_failure_key = next(iter(self.tracker.issues))
+        assert self.tracker.calls['create'] == 1
+
+    async def then_it_should_comment_mass_failure_issue_in_next_runs(self):
+        assert len(self.tracker.comments[self.mass_failure_key]) == 2
+        for comment in self.tracker.comments[self.mass_failure_key]:
+            assert comment.startswith('Repeated mass failure: 3 tests failed')
+
+    async def then_it_should_add_existing_issue_to_summary_of_next_runs(self):
+        expected_summary = EN_REPORTING_LANG.MASS_FAILURE_ISSUE_EXISTS.format(
+            count=3,
+            jira_server='http://fake',
+            issue_key=self.mass_failure_key,
+        )
+        assert [report.summary for report in self.reports[1:]] == [
+            [expected_summary], [expected_summary]
+        ]
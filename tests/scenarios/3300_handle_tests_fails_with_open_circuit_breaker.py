@@ -0,0 +1,119 @@
+import asyncio
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import RU_REPORTING_LANG
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_create_unavailable
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            # failures are searched together, so their creates fail in a row
+            # and default threshold of 3 failed requests opens circuit breaker
+            jira_search_batch_size: int = 4
+            jira_circuit_breaker_cooldown: float = 0.5
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenarios(self):
+        self.tests_dir = Path('/tmp/tests')
+
+        self.failed_scenarios = []
+        for _ in range(5):
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    def _fail(self, failed_scenario):
+        with temp_file(failed_scenario.scenario.path, failed_scenario.traced_file.file_content):
+            self.plugin.on_scenario_failed(
+                ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result)
+            )
+
+    async def when_jira_fails_then_recovers_after_cooldown(self):
+        with (
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search() as self.jira_search_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_create_unavailable(times=3) as self.jira_create_unavailable_mock,
+        ):
+            for failed_scenario in self.failed_scenarios[:4]:
+                self._fail(failed_scenario)
+            await asyncio.sleep(self.plugin_config.jira_circuit_breaker_cooldown)
+            self._fail(self.failed_scenarios[4])
+            self.plugin.on_cleanup(CleanupEvent(Report()))
+
+    async def then_it_should_open_circuit_after_three_failed_creates(self):
+        assert self.jira_create_unavailable_mock.history == HistorySchema.len(3)
+
+    async def then_it_should_skip_create_while_circuit_is_open(self):
+        for failed_scenario in self.failed_scenarios[:4]:
+            assert failed_scenario.scenario_result.extra_details == [
+                RU_REPORTING_LANG.SKIP_CREATING_ISSUE_DUE_TO_JIRA_CREATE_UNAVAILABILITY.format(
+                    jira_server=self.plugin_config.jira_server
+                )
+            ]
+
+    async def then_it_should_close_circuit_after_cooldown(self):
+        # search of scenario failed after cooldown is probe request closing circuit
+        assert self.jira_search_mock.history == HistorySchema.len(2)
+        assert self.jira_create_mock.history == HistorySchema.len(1)
+        assert self.failed_scenarios[4].scenario_result.extra_details == [
+            RU_REPORTING_LANG.ISSUE_CREATED.format(
+                jira_server=self.plugin_config.jira_server,
+                issue_key='WORKSPACE-123',
+            )
+        ]
@@ -0,0 +1,136 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_create_comment
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_get_issue
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            jira_search_batch_size: int = 2
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenarios(self):
+        self.tests_dir = Path('/tmp/tests')
+
+        self.failed_scenarios = []
+        for _ in range(2):
+            scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def given_failed_scenario_events(self):
+        self.events = [
+            ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result)
+            for failed_scenario in self.failed_scenarios
+        ]
+
+    async def given_jira_search_result(self):
+        self.found_issue_key = 'WORKSPACE-1276'
+        self.jira_search_result = {
+            "startAt": 0,
+            "maxResults": 50,
+            "total": 1,
+            "issues": [
+                {
+                    "key": self.found_issue_key,
+                    "fields": {
+                        "description": f'{self.failed_scenarios[0].scenario.rel_path}',
+                    },
+                },
+            ]
+        }
+
+    async def when_vedro_fires_plugin_handler_for_each_fail(self):
+        with (
+            temp_file(self.failed_scenarios[0].scenario.path, self.failed_scenarios[0].traced_file.file_content),
+            temp_file(self.failed_scenarios[1].scenario.path, self.failed_scenarios[1].traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search(jira_response=self.jira_search_result) as self.jira_search_mock,
+            mocked_jira_create(key='WORKSPACE-123') as self.jira_create_mock,
+            mocked_jira_create_comment(key=self.found_issue_key) as self.jira_create_comment_mock,
+            mocked_jira_get_issue(key='WORKSPACE-123') as self.jira_get_issue_mock,
+        ):
+            for event in self.events:
+                self.plugin.on_scenario_failed(event)
+
+    async def then_it_should_call_jira_for_search_once(self):
+        self.search_history = self.jira_search_mock.history
+
+        self.expected_statuses = ','.join([f'"{status}"' for status in self.plugin_config.jira_search_statuses])
+        assert self.search_history == HistorySchema % [
+            {
+                'request': {
+                    "method": 'GET',
+                    "path": '/rest/api/2/search',
+                    "params": {
+                        "jql": f'project = {self.plugin_config.jira_project} '
+                               f'and (description ~ "\\"{self.failed_scenarios[0].scenario.rel_path}\\"" '
+                               f'or description ~ "\\"{self.failed_scenarios[1].scenario.rel_path}\\"") '
+                               f'and status in ({self.expected_statuses}) '
+                               f'and labels = {self.plugin_config.jira_flaky_label} '
+                               f'ORDER BY created',
+                        "startAt": "0",
+                        "validateQuery": "True",
+                        "fields": "*all",
+                        "maxResults": "100",
+                    },
+                },
+            }
+        ]
+
+    async def then_it_should_call_jira_for_adding_comment_to_existing(self):
+        assert self.jira_create_comment_mock.history == HistorySchema.len(1)
+
+    async def then_it_should_call_jira_for_create_new_issue_once(self):
+        assert self.jira_create_mock.history == HistorySchema.len(1)
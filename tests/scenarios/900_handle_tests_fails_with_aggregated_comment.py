@@ -0,0 +1,116 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from d42 import fake
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+from jj_d42 import HistorySchema
+from vedro.core import Report
+from vedro.events import CleanupEvent
+from vedro.events import ScenarioFailedEvent
+
+from contexts.mocks.mocked_failed_scenario_result import mocked_failed_scenario_result
+from contexts.mocks.mocked_jira import mocked_jira_create
+from contexts.mocks.mocked_jira import mocked_jira_create_comment
+from contexts.mocks.mocked_jira import mocked_jira_fields
+from contexts.mocks.mocked_jira import mocked_jira_search
+from contexts.mocks.mocked_jira import mocked_jira_server_info
+from contexts.mocks.mocked_python_traceback import mocked_traced_file
+from helpers.temp_file import temp_file
+from schemas.scenario import ScenarioNameSchema
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_plugin_initialized(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            report_enabled = False  # enable it when flaky run
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+            jira_components: list[str] = ['world']
+            jira_labels: list[str] = ['new_flaky', 'qa_tech_debt']  # extra labels
+            jira_flaky_label: str = 'flaky'
+
+            jira_additional_data: dict[str, str] = {}
+            jira_issue_type_id: str = '3'
+            report_project_name: str = 'SomeAppName'
+            job_path = 'gitlab/{job_id}'
+            job_id: str = '4'
+
+            dry_run: bool = False
+
+            exceptions: list[str] = [r'.*codec can\'t decode byte.*']
+
+            jira_aggregate_comments: bool = True
+
+        self.plugin_config = _Flakyzavr
+        self.plugin = FlakyzavrPlugin(config=self.plugin_config)
+
+    async def given_failed_scenarios_of_same_file(self):
+        self.tests_dir = Path('/tmp/tests')
+
+        self.failed_scenarios = []
+        scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        for _ in range(3):
+            traced_file = mocked_traced_file(
+                filename=self.tests_dir / scenario_project_filename,
+                line_start=2,
+                line_target=4,
+            )
+            self.failed_scenarios.append(mocked_failed_scenario_result(
+                scenario_name=fake(ScenarioNameSchema),
+                scenario_project_filename=scenario_project_filename,
+                traced_file=traced_file,
+                tests_dir=self.tests_dir,
+            ))
+
+    async def given_failed_scenario_events(self):
+        self.events = [
+            ScenarioFailedEvent(scenario_result=failed_scenario.scenario_result)
+            for failed_scenario in self.failed_scenarios
+        ]
+
+    async def given_jira_search_result(self):
+        self.found_issue_key = 'WORKSPACE-1276'
+        self.jira_search_result = {
+            "startAt": 0,
+            "maxResults": 50,
+            "total": 1,
+            "issues": [
+                {
+                    "key": self.found_issue_key,
+                },
+            ]
+        }
+
+    async def when_vedro_fires_plugin_handlers_and_cleanup(self):
+        with (
+            temp_file(self.failed_scenarios[0].scenario.path, self.failed_scenarios[0].traced_file.file_content),
+            mocked_jira_server_info() as self.jira_server_info_mock,
+            mocked_jira_fields() as self.jira_fields_mock,
+            mocked_jira_search(jira_response=self.jira_search_result) as self.jira_search_mock,
+            mocked_jira_create() as self.jira_create_mock,
+            mocked_jira_create_comment(key=self.found_issue_key) as self.jira_create_comment_mock,
+        ):
+            for event in self.events:
+                self.plugin.on_scenario_failed(event)
+            self.plugin.on_cleanup(CleanupEvent(Report()))
+
+    async def then_it_should_call_jira_for_search_once(self):
+        assert self.jira_search_mock.history == HistorySchema.len(1)
+
+    async def then_it_should_not_call_jira_for_create_new_issue(self):
+        assert self.jira_create_mock.history == HistorySchema % []
+
+    async def then_it_should_call_jira_for_adding_one_aggregated_comment(self):
+        self.create_comment_history = self.jira_create_comment_mock.history
+
+        assert self.create_comment_history == HistorySchema.len(1)
+        comment = self.create_comment_history[0]['request'].body['body']
+        assert comment.startswith('Повторный флак, падений за прогон: 3\n')
+        assert comment.count('{code:python}') == 2
@@ -0,0 +1,46 @@
+from pathlib import Path
+from time import monotonic_ns
+
+import vedro
+from flakyzavr._traceback import render_tb
+
+from helpers.temp_file import temp_file
+
+SCENARIO_SOURCE = '''\
+# scenario step failing at the bottom of deep recursion
+def call(depth):
+    if depth == 0:
+        assert {"status": 500} == {"status": 200}
+    return call(depth - 1)
+'''
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_scenario_file_failed_in_deep_recursion(self):
+        self.tests_dir = Path('/tmp/tests')
+        self.scenario_project_filename = Path(f'scenarios/scenario_{monotonic_ns()}.py')
+        self.scenario_path = self.tests_dir / self.scenario_project_filename
+        namespace = {}
+        exec(compile(SCENARIO_SOURCE, str(self.scenario_path), 'exec'), namespace)
+        try:
+            namespace['call'](499)
+        except AssertionError as error:
+            # frame of this step is not part of scenario traceback
+            self.traceback = error.__traceback__.tb_next
+
+    async def when_traceback_is_rendered_with_max_frames(self):
+        with temp_file(self.scenario_path, SCENARIO_SOURCE):
+            self.rendered = render_tb(self.traceback, str(self.scenario_project_filename), max_frames=4)
+
+    async def then_it_should_render_only_max_frames(self):
+        assert self.rendered.count(f'# {self.scenario_path}:') == 4
+
+    async def then_it_should_mark_skipped_frames(self):
+        assert self.rendered.split('\n\n')[2] == '# ... 496 frames skipped ...'
+
+    async def then_it_should_keep_failed_line(self):
+        assert self.rendered.split('\n')[-2:] == [
+            '>   4|        assert {"status": 500} == {"status": 200}',
+            '    5|    return call(depth - 1)',
+        ]
@@ -0,0 +1,29 @@
+import vedro
+from flakyzavr import Flakyzavr
+from flakyzavr import FlakyzavrPlugin
+
+
+class Scenario(vedro.Scenario):
+
+    async def given_config_without_traceback_frames(self):
+        class _Flakyzavr(Flakyzavr):
+            enabled = True
+
+            jira_server: str = 'http://mock'
+            jira_token: str = 'jira_token'
+            jira_project: str = 'jira_project'
+
+            traceback_max_frames: int = 0
+
+        self.plugin_config = _Flakyzavr
+
+    async def when_plugin_is_initialized(self):
+        try:
+            FlakyzavrPlugin(config=self.plugin_config)
+        except ValueError as error:
+            self.error = error
+        else:
+            self.error = None
+
+    async def then_it_should_reject_config(self):
+        assert str(self.error) == 'traceback_max_frames must be at least 1, got 0'